@@ -129,7 +129,7 @@ def _build_fruits_page(page: int) -> tuple[str, list[list[dict[str, str]]]]:
 
     lines = [f"Fruits (page {page + 1}/{paginator.total_pages}):"]
     builder = InlineKeyboardBuilder()
-    for i, fruit in enumerate(paginator.page_data, paginator.offset + 1):
+    for i, fruit in enumerate(paginator.iter_page(), paginator.offset + 1):
         lines.append(f"  {i}. {fruit}")
         builder.button(text=fruit, callback_data=f"fruit:{fruit}")
     builder.adjust(1)
@@ -19,11 +19,13 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import io
 import json
 import logging
 import os
 import signal
 import sys
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -55,11 +57,55 @@ def ts() -> str:
     return datetime.now(UTC).isoformat()
 
 
+# One append-only handle for the whole session. O_APPEND keeps every line
+# atomic even if another process writes to the same file; the 1 MiB buffer
+# turns per-event writes into a few large write() syscalls.
+_log_fp: io.BufferedWriter | None = None
+
+
+def _log_file() -> io.BufferedWriter:
+    global _log_fp
+    if _log_fp is None:
+        fd = os.open(LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        _log_fp = io.BufferedWriter(io.FileIO(fd, mode="ab", closefd=True), buffer_size=1 << 20)
+    return _log_fp
+
+
+# One JSON line per entry, byte-identical on both paths: compact separators,
+# and datetimes/dataclasses go through default=str on orjson as on json.
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+
+    def _dumpb(entry: dict[str, Any]) -> bytes:
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":"), default=str)
+        return (line + "\n").encode("utf-8")
+
+else:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_APPEND_NEWLINE
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def _dumpb(entry: dict[str, Any]) -> bytes:
+        return orjson.dumps(entry, default=str, option=_ORJSON_OPTIONS)
+
+
 def write_log(entry: dict[str, Any]) -> None:
-    """Append one JSON line to the log file."""
+    """Append one JSON line to the log buffer (see ``flush_log``)."""
     entry.setdefault("_ts", ts())
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+    _log_file().write(_dumpb(entry))
+
+
+def flush_log(sync: bool = False) -> None:
+    """Push buffered lines to the log file; ``sync=True`` also fsyncs it."""
+    if _log_fp is None:
+        return
+    _log_fp.flush()
+    if sync:
+        os.fsync(_log_fp.fileno())
 
 
 def safe_dump(obj: Any) -> Any:
@@ -377,6 +423,106 @@ def describe_event(event: dict[str, Any]) -> str:
 # ── Bot commands ───────────────────────────────────────────────────────────
 
 
+async def _cmd_start(client: DiagnosticClient, chat_id: str, payload: dict[str, Any]) -> None:
+    builder = InlineKeyboardBuilder()
+    builder.button(text="Button A", callback_data="diag_a")
+    builder.button(text="Button B", callback_data="diag_b")
+    builder.button(text="Alert btn", callback_data="diag_alert")
+    builder.button(text="URL btn", url="https://example.com")
+    builder.adjust(2, 2)
+
+    await client.send_text(
+        chat_id,
+        "Diagnostic bot ready.\n\n"
+        "I log ALL raw events to diagnostic_log.jsonl.\n\n"
+        "Try:\n"
+        "- Send any text, image, file, sticker, voice\n"
+        "- Forward a message\n"
+        "- Reply to a message\n"
+        "- React to a message\n"
+        "- Create a poll\n"
+        "- Pin/unpin a message\n"
+        "- Add/remove users from group\n"
+        "- Change chat title/description\n"
+        "- Click the buttons below\n"
+        "- /info — chat info\n"
+        "- /admins — chat admins\n"
+        "- /members — chat members\n"
+        "- /me — bot info\n"
+        "- /stats — logging stats",
+        inlineKeyboardMarkup=builder.as_json(),
+    )
+
+
+async def _cmd_info(client: DiagnosticClient, chat_id: str, payload: dict[str, Any]) -> None:
+    data = await client.get_chat_info(chat_id)
+    await client.send_text(
+        chat_id, f"Chat info:\n{json.dumps(data, ensure_ascii=False, indent=2)[:4000]}"
+    )
+
+
+async def _cmd_admins(client: DiagnosticClient, chat_id: str, payload: dict[str, Any]) -> None:
+    data = await client.get_chat_admins(chat_id)
+    await client.send_text(
+        chat_id, f"Admins:\n{json.dumps(data, ensure_ascii=False, indent=2)[:4000]}"
+    )
+
+
+async def _cmd_members(client: DiagnosticClient, chat_id: str, payload: dict[str, Any]) -> None:
+    data = await client.get_chat_members(chat_id)
+    await client.send_text(
+        chat_id, f"Members:\n{json.dumps(data, ensure_ascii=False, indent=2)[:4000]}"
+    )
+
+
+async def _cmd_me(client: DiagnosticClient, chat_id: str, payload: dict[str, Any]) -> None:
+    data = await client.get_me()
+    await client.send_text(
+        chat_id, f"Bot info:\n{json.dumps(data, ensure_ascii=False, indent=2)[:4000]}"
+    )
+
+
+async def _cmd_stats(client: DiagnosticClient, chat_id: str, payload: dict[str, Any]) -> None:
+    flush_log()
+    if not LOG_FILE.exists():
+        await client.send_text(chat_id, "No log file yet.")
+        return
+
+    with open(LOG_FILE, encoding="utf-8") as fh:
+        line_count = sum(1 for _ in fh)
+    size_kb = LOG_FILE.stat().st_size / 1024
+    # Count event types
+    type_counts: dict[str, int] = {}
+    with open(LOG_FILE, encoding="utf-8") as f:
+        for line in f:
+            try:
+                obj = json.loads(line)
+                if obj.get("_type") == "RAW_EVENT":
+                    et = obj.get("type", "?")
+                    type_counts[et] = type_counts.get(et, 0) + 1
+            except Exception:
+                pass
+    stats_text = (
+        f"Log file: {LOG_FILE.name}\n"
+        f"Lines: {line_count}\n"
+        f"Size: {size_kb:.1f} KB\n\n"
+        f"Event types captured:\n"
+    )
+    for et, cnt in sorted(type_counts.items(), key=lambda x: -x[1]):
+        stats_text += f"  {et}: {cnt}\n"
+    await client.send_text(chat_id, stats_text)
+
+
+_COMMANDS: dict[str, Callable[[DiagnosticClient, str, dict[str, Any]], Awaitable[None]]] = {
+    "/start": _cmd_start,
+    "/info": _cmd_info,
+    "/admins": _cmd_admins,
+    "/members": _cmd_members,
+    "/me": _cmd_me,
+    "/stats": _cmd_stats,
+}
+
+
 async def handle_command(
     client: DiagnosticClient,
     chat_id: str,
@@ -384,89 +530,11 @@ async def handle_command(
     payload: dict[str, Any],
 ) -> None:
     """Handle /commands for interactive testing."""
-    cmd = text.strip().split()[0].lower()
-
-    if cmd == "/start":
-        builder = InlineKeyboardBuilder()
-        builder.button(text="Button A", callback_data="diag_a")
-        builder.button(text="Button B", callback_data="diag_b")
-        builder.button(text="Alert btn", callback_data="diag_alert")
-        builder.button(text="URL btn", url="https://example.com")
-        builder.adjust(2, 2)
-
-        await client.send_text(
-            chat_id,
-            "Diagnostic bot ready.\n\n"
-            "I log ALL raw events to diagnostic_log.jsonl.\n\n"
-            "Try:\n"
-            "- Send any text, image, file, sticker, voice\n"
-            "- Forward a message\n"
-            "- Reply to a message\n"
-            "- React to a message\n"
-            "- Create a poll\n"
-            "- Pin/unpin a message\n"
-            "- Add/remove users from group\n"
-            "- Change chat title/description\n"
-            "- Click the buttons below\n"
-            "- /info — chat info\n"
-            "- /admins — chat admins\n"
-            "- /members — chat members\n"
-            "- /me — bot info\n"
-            "- /stats — logging stats",
-            inlineKeyboardMarkup=builder.as_json(),
-        )
-
-    elif cmd == "/info":
-        data = await client.get_chat_info(chat_id)
-        await client.send_text(
-            chat_id, f"Chat info:\n{json.dumps(data, ensure_ascii=False, indent=2)[:4000]}"
-        )
-
-    elif cmd == "/admins":
-        data = await client.get_chat_admins(chat_id)
-        await client.send_text(
-            chat_id, f"Admins:\n{json.dumps(data, ensure_ascii=False, indent=2)[:4000]}"
-        )
-
-    elif cmd == "/members":
-        data = await client.get_chat_members(chat_id)
-        await client.send_text(
-            chat_id, f"Members:\n{json.dumps(data, ensure_ascii=False, indent=2)[:4000]}"
-        )
-
-    elif cmd == "/me":
-        data = await client.get_me()
-        await client.send_text(
-            chat_id, f"Bot info:\n{json.dumps(data, ensure_ascii=False, indent=2)[:4000]}"
-        )
-
-    elif cmd == "/stats":
-        if LOG_FILE.exists():
-            with open(LOG_FILE, encoding="utf-8") as fh:
-                line_count = sum(1 for _ in fh)
-            size_kb = LOG_FILE.stat().st_size / 1024
-            # Count event types
-            type_counts: dict[str, int] = {}
-            with open(LOG_FILE, encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        obj = json.loads(line)
-                        if obj.get("_type") == "RAW_EVENT":
-                            et = obj.get("type", "?")
-                            type_counts[et] = type_counts.get(et, 0) + 1
-                    except Exception:
-                        pass
-            stats_text = (
-                f"Log file: {LOG_FILE.name}\n"
-                f"Lines: {line_count}\n"
-                f"Size: {size_kb:.1f} KB\n\n"
-                f"Event types captured:\n"
-            )
-            for et, cnt in sorted(type_counts.items(), key=lambda x: -x[1]):
-                stats_text += f"  {et}: {cnt}\n"
-            await client.send_text(chat_id, stats_text)
-        else:
-            await client.send_text(chat_id, "No log file yet.")
+    # Commands are short — only split the head of the text, not the whole message
+    cmd = text[:16].lstrip().split(maxsplit=1)[0].lower()
+    handler = _COMMANDS.get(cmd)
+    if handler:
+        await handler(client, chat_id, payload)
 
 
 # ── Main loop ──────────────────────────────────────────────────────────────
@@ -511,6 +579,8 @@ async def main() -> None:
     log.info("Skipped old events, lastEventId=%d", client._last_event_id)
 
     while running:
+        # Drain the buffer before blocking on the long poll
+        flush_log()
         try:
             events = await client.get_events(poll_time=30)
         except asyncio.CancelledError:
@@ -631,6 +701,7 @@ async def main() -> None:
                 )
 
     write_log({"_type": "SESSION_END"})
+    flush_log(sync=True)
     await client.close()
     log.info("Stopped. Log saved to %s", LOG_FILE)
 
@@ -640,3 +711,5 @@ if __name__ == "__main__":
         asyncio.run(main())
     except KeyboardInterrupt:
         log.info("Interrupted")
+    finally:
+        flush_log(sync=True)
@@ -6,49 +6,190 @@ and assembles a single Markdown reference that any LLM can use
 to write VK Teams bots without reading the docs.
 
 Usage:
-    python scripts/gen_llm_ref.py
+    python scripts/gen_llm_ref.py          # skips work if sources are unchanged
+    python scripts/gen_llm_ref.py --force  # always regenerate
 """
 
 from __future__ import annotations
 
+import argparse
 import ast
+import asyncio
+import functools
+import hashlib
+import pickle
 import re
+import string
+import sys
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 ROOT = Path(__file__).resolve().parent.parent
 SRC = ROOT / "vkworkspace"
 OUTPUT = ROOT / "llm_full.md"
+# Content hash of the inputs OUTPUT was last generated from
+HASH_FILE = OUTPUT.with_name(f".{OUTPUT.name}.hash")
+
+# Parsed ASTs are pickled here, keyed by the SHA-256 of the source bytes.
+# AST pickles are tied to the interpreter, hence the cache_tag prefix;
+# bump _AST_CACHE_VERSION when the cached shape changes.
+AST_CACHE_DIR = ROOT / ".cache" / "llm_ref_ast"
+_AST_CACHE_VERSION = 1
+_AST_CACHE_PREFIX = f"{sys.implementation.cache_tag}-v{_AST_CACHE_VERSION}"
+_ast_cache_stats = {"hits": 0, "misses": 0}
+
+_ENUM_FILES: list[tuple[str, str]] = [
+    ("ChatAction", "chat_action.py"),
+    ("ChatType", "chat_type.py"),
+    ("ParseMode", "parse_mode.py"),
+    ("EventType", "event_type.py"),
+    ("ButtonStyle", "button_style.py"),
+    ("PartType", "part_type.py"),
+    ("StyleType", "style_type.py"),
+]
+
+BOT_PY = SRC / "client" / "bot.py"
+ROUTER_PY = SRC / "dispatcher" / "router.py"
+TYPES_INIT_PY = SRC / "types" / "__init__.py"
+ENUM_PATHS = tuple(SRC / "enums" / filename for _, filename in _ENUM_FILES)
+
+# Markdown tokens shared by the generated (non-literal) sections
+_PY_OPEN = "```python\n"
+_FENCE = "```\n"
+_HR = "\n---"
+
+_VERSION_RE = re.compile(rb'__version__\s*=\s*"([^"]+)"')
+_ENDPOINT_RE = re.compile(r"``([a-zA-Z]+/[a-zA-Z/.]+)``")
+_ENDPOINT_STRIP_RE = re.compile(r"\s*``[^`]+``\s*")
 
 
 # ── Extractors ────────────────────────────────────────────────────────
 
 
+def _ast_cache_file(data: bytes) -> Path:
+    return AST_CACHE_DIR / f"{_AST_CACHE_PREFIX}-{hashlib.sha256(data).hexdigest()}.pkl"
+
+
+def _load_cached(path: Path) -> ast.Module | None:
+    """Return the on-disk cached tree for *path*, or ``None`` on a miss."""
+    try:
+        with _ast_cache_file(path.read_bytes()).open("rb") as f:
+            tree = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    return tree if isinstance(tree, ast.Module) else None
+
+
+def _parse_file(path: Path) -> ast.Module:
+    """Parse *path* and store the tree in the disk cache."""
+    data = path.read_bytes()
+    tree = ast.parse(data, filename=str(path))
+    cached = _ast_cache_file(data)
+    try:
+        AST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_suffix(".tmp")
+        with tmp.open("wb") as f:
+            pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(cached)
+    except OSError:
+        pass  # cache is best-effort
+    return tree
+
+
+# Trees loaded in this run, shared by all extractors
+_trees: dict[Path, ast.Module] = {}
+
+
+def _parse(path: Path) -> ast.Module:
+    """Parse a source file once per run; extractors share the tree.
+
+    Trees are also cached on disk, so unchanged files are never re-parsed.
+    """
+    tree = _trees.get(path)
+    if tree is not None:
+        return tree
+    tree = _load_cached(path)
+    if tree is not None:
+        _ast_cache_stats["hits"] += 1
+    else:
+        _ast_cache_stats["misses"] += 1
+        tree = _parse_file(path)
+    _trees[path] = tree
+    return tree
+
+
+def _preparse(paths: list[Path]) -> None:
+    """Load every file in *paths* up front, from the disk cache or by parsing.
+
+    Sequential on purpose: the sources are small, and starting worker
+    processes costs more than parsing them.
+    """
+    for path in paths:
+        _parse(path)
+
+
+def _top_classes(mod: ast.Module) -> dict[str, ast.ClassDef]:
+    """Index module-level classes by name (no descent into nested nodes)."""
+    return {node.name: node for node in mod.body if isinstance(node, ast.ClassDef)}
+
+
+def _bot_class() -> ast.ClassDef | None:
+    """Return the ``Bot`` ClassDef from client/bot.py."""
+    return _top_classes(_parse(BOT_PY)).get("Bot")
+
+
 def get_version() -> str:
     """Read __version__ from __meta__.py."""
-    text = (SRC / "__meta__.py").read_text(encoding="utf-8")
-    m = re.search(r'__version__\s*=\s*"([^"]+)"', text)
-    return m.group(1) if m else "0.0.0"
+    m = _VERSION_RE.search((SRC / "__meta__.py").read_bytes())
+    return m.group(1).decode("utf-8") if m else "0.0.0"
 
 
 def _first_line_docstring(node: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
-    """Extract the first line of a function/method docstring."""
-    ds = ast.get_docstring(node)
-    if not ds:
-        return ""
-    return ds.split("\n")[0].strip()
-
-
-def _extract_endpoint(docstring: str) -> str:
-    """Extract API endpoint from docstring like 'Send text. ``messages/sendText``'."""
-    m = re.search(r"``([a-zA-Z]+/[a-zA-Z/.]+)``", docstring)
-    return m.group(1) if m else ""
+    """Extract the first line of a function/method docstring.
+
+    The result is stashed on the node itself, so repeat lookups are free.
+    """
+    cached: str | None = getattr(node, "_doc_cache", None)
+    if cached is not None:
+        return cached
+    # Read the string constant directly — ast.get_docstring would run
+    # inspect.cleandoc over the whole docstring just to keep one line.
+    line = ""
+    body = node.body
+    if (
+        body
+        and isinstance(stmt := body[0], ast.Expr)
+        and isinstance(stmt.value, ast.Constant)
+        and isinstance(doc := stmt.value.value, str)
+    ):
+        line = doc.lstrip().split("\n", 1)[0].strip()
+    setattr(node, "_doc_cache", line)  # noqa: B010
+    return line
+
+
+@functools.cache
+def _split_endpoint(docstring: str) -> tuple[str, str]:
+    """Split 'Send text. ``messages/sendText``' into (endpoint, description).
+
+    The endpoint span found by the search is sliced out of the description;
+    the strip regex only runs when other ````code```` spans remain.
+    """
+    m = _ENDPOINT_RE.search(docstring)
+    if m is None:
+        return "", _ENDPOINT_STRIP_RE.sub("", docstring).strip().rstrip(".")
+    desc = f"{docstring[: m.start()].rstrip()}{docstring[m.end() :].lstrip()}"
+    if "``" in desc:
+        desc = _ENDPOINT_STRIP_RE.sub("", desc)
+    return m.group(1), desc.strip().rstrip(".")
 
 
 def _return_annotation(node: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
     """Get return type annotation as string."""
     if node.returns is None:
         return ""
-    return ast.unparse(node.returns)
+    return _cheap_unparse(node.returns)
 
 
 _SKIP_BOT_METHODS = {"get_session", "close", "get_events"}
@@ -59,180 +200,197 @@ _ENDPOINT_FALLBACK: dict[str, str] = {
 }
 
 
-def extract_bot_methods() -> list[dict[str, str]]:
-    """Parse bot.py → public async methods with name, endpoint, description, return type."""
-    tree = ast.parse((SRC / "client" / "bot.py").read_text(encoding="utf-8"))
-    methods: list[dict[str, str]] = []
+def _cheap_unparse(node: ast.expr, quote: str | None = None) -> str:
+    """``ast.unparse`` with direct rendering of the node shapes params actually use.
+
+    Names, literals, dotted attributes, subscripts and ``X | Y`` unions are
+    built by hand; anything else falls back to the full unparser. With
+    ``quote='"'`` string literals come out double-quoted, ready for the docs.
+    """
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Constant) and node.value is not Ellipsis:
+        value = node.value
+        literal = repr(value)
+        if quote is not None and isinstance(value, str) and literal[0] != quote:
+            # repr escapes backslashes and control characters but leaves the
+            # other quote bare; re-delimit and escape that one
+            literal = quote + literal[1:-1].replace(quote, "\\" + quote) + quote
+        return literal
+    if isinstance(node, ast.Attribute):
+        return f"{_cheap_unparse(node.value, quote)}.{node.attr}"
+    if isinstance(node, ast.Subscript):
+        sl = node.slice
+        inner = (
+            ", ".join(_cheap_unparse(e, quote) for e in sl.elts)
+            if isinstance(sl, ast.Tuple) and sl.elts
+            else _cheap_unparse(sl, quote)
+        )
+        return f"{_cheap_unparse(node.value, quote)}[{inner}]"
+    if (
+        isinstance(node, ast.BinOp)
+        and isinstance(node.op, ast.BitOr)
+        and not isinstance(node.right, ast.BinOp)  # would need parentheses
+    ):
+        return f"{_cheap_unparse(node.left, quote)} | {_cheap_unparse(node.right, quote)}"
+    return ast.unparse(node)
+
+
+def _default(node: ast.expr | None, skip_unset: bool) -> str:
+    """Source of a parameter default (``""`` if it has none)."""
+    if node is None:
+        return ""
+    raw = _cheap_unparse(node, quote='"')
+    return "" if skip_unset and raw == "_UNSET" else raw
+
+
+def _param_dicts(
+    func: ast.FunctionDef | ast.AsyncFunctionDef,
+    skip_unset: bool = False,
+) -> list[dict[str, str]]:
+    """Describe a method's parameters (``self`` skipped) as name/type/default dicts."""
+    args = func.args.args[1:]  # skip self
+    defaults = func.args.defaults
+    # Defaults belong to the trailing args — pad the front so they line up
+    padded: list[ast.expr | None] = [None] * (len(args) - len(defaults))
+    padded.extend(defaults)
+    return [
+        {
+            "name": a.arg,
+            "type": _cheap_unparse(a.annotation) if a.annotation else "",
+            "default": _default(d, skip_unset),
+        }
+        for a, d in zip(args, padded, strict=True)
+    ]
 
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.ClassDef) or node.name != "Bot":
+
+def _method_info(item: ast.AsyncFunctionDef) -> dict[str, str]:
+    """Describe a public Bot method: name, endpoint, description, return type."""
+    endpoint, desc = _split_endpoint(_first_line_docstring(item))
+    endpoint = endpoint or _ENDPOINT_FALLBACK.get(item.name, "")
+    return {
+        "name": item.name,
+        "endpoint": endpoint,
+        "description": desc,
+        "return": _return_annotation(item),
+    }
+
+
+@functools.cache
+def _scan_bot(cls: ast.ClassDef) -> dict[str, list[dict[str, str]]]:
+    """Walk the Bot class body once, collecting everything the Bot extractors need."""
+    result: dict[str, list[dict[str, str]]] = {
+        "init_params": [],
+        "send_text_params": [],
+        "methods": [],
+    }
+    for item in cls.body:
+        if isinstance(item, ast.FunctionDef):
+            if item.name == "__init__":
+                result["init_params"] = _param_dicts(item)
             continue
-        for item in node.body:
-            if not isinstance(item, ast.AsyncFunctionDef):
-                continue
-            if item.name.startswith("_") or item.name in _SKIP_BOT_METHODS:
-                continue
-
-            doc = _first_line_docstring(item)
-            endpoint = _extract_endpoint(doc) or _ENDPOINT_FALLBACK.get(item.name, "")
-            # Strip endpoint from description
-            desc = re.sub(r"\s*``[^`]+``\s*", "", doc).strip().rstrip(".")
-            ret = _return_annotation(item)
-
-            methods.append(
-                {
-                    "name": item.name,
-                    "endpoint": endpoint,
-                    "description": desc,
-                    "return": ret,
-                }
-            )
-    return methods
+        if not isinstance(item, ast.AsyncFunctionDef):
+            continue
+        if item.name == "send_text":
+            result["send_text_params"] = _param_dicts(item, skip_unset=True)
+        if item.name.startswith("_") or item.name in _SKIP_BOT_METHODS:
+            continue
+        result["methods"].append(_method_info(item))
+    return result
+
+
+def extract_bot_methods() -> list[dict[str, str]]:
+    """Parse bot.py → public async methods with name, endpoint, description, return type."""
+    cls = _bot_class()
+    return _scan_bot(cls)["methods"] if cls is not None else []
 
 
 def extract_bot_init_params() -> list[dict[str, str]]:
     """Extract Bot.__init__ parameters with defaults."""
-    tree = ast.parse((SRC / "client" / "bot.py").read_text(encoding="utf-8"))
-
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.ClassDef) or node.name != "Bot":
-            continue
-        for item in node.body:
-            if not isinstance(item, ast.FunctionDef) or item.name != "__init__":
-                continue
-            params: list[dict[str, str]] = []
-            args = item.args
-            # Skip 'self'
-            all_args = args.args[1:]
-            defaults_offset = len(all_args) - len(args.defaults)
-            for i, arg in enumerate(all_args):
-                name = arg.arg
-                ann = ast.unparse(arg.annotation) if arg.annotation else ""
-                default_idx = i - defaults_offset
-                default = ""
-                if default_idx >= 0 and default_idx < len(args.defaults):
-                    default = ast.unparse(args.defaults[default_idx])
-                params.append({"name": name, "type": ann, "default": default})
-            return params
-    return []
+    cls = _bot_class()
+    return _scan_bot(cls)["init_params"] if cls is not None else []
 
 
 def extract_send_text_params() -> list[dict[str, str]]:
     """Extract send_text parameters."""
-    tree = ast.parse((SRC / "client" / "bot.py").read_text(encoding="utf-8"))
-
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.ClassDef) or node.name != "Bot":
-            continue
-        for item in node.body:
-            if not isinstance(item, ast.AsyncFunctionDef) or item.name != "send_text":
-                continue
-            params: list[dict[str, str]] = []
-            args = item.args
-            all_args = args.args[1:]  # skip self
-            defaults_offset = len(all_args) - len(args.defaults)
-            for i, arg in enumerate(all_args):
-                name = arg.arg
-                ann = ast.unparse(arg.annotation) if arg.annotation else ""
-                default_idx = i - defaults_offset
-                default = ""
-                if default_idx >= 0 and default_idx < len(args.defaults):
-                    raw = ast.unparse(args.defaults[default_idx])
-                    if raw != "_UNSET":
-                        default = raw
-                params.append({"name": name, "type": ann, "default": default})
-            return params
-    return []
+    cls = _bot_class()
+    return _scan_bot(cls)["send_text_params"] if cls is not None else []
+
+
+# Router observer → short description for the decorator listing
+_OBSERVER_DESCRIPTIONS: dict[str, str] = {
+    "message": "any message",
+    "edited_message": "edited messages",
+    "deleted_message": "deleted messages",
+    "callback_query": "inline button presses",
+    "new_chat_members": "user joined",
+    "left_chat_members": "user left",
+    "pinned_message": "message pinned",
+    "unpinned_message": "message unpinned",
+    "changed_chat_info": "chat info changed",
+    "error": "unhandled exceptions",
+}
 
 
 def extract_router_observers() -> list[dict[str, str]]:
     """Extract event observer names and comments from router.py."""
-    tree = ast.parse((SRC / "dispatcher" / "router.py").read_text(encoding="utf-8"))
-
-    # Get observer descriptions from the docstring
-    descriptions: dict[str, str] = {
-        "message": "any message",
-        "edited_message": "edited messages",
-        "deleted_message": "deleted messages",
-        "callback_query": "inline button presses",
-        "new_chat_members": "user joined",
-        "left_chat_members": "user left",
-        "pinned_message": "message pinned",
-        "unpinned_message": "message unpinned",
-        "changed_chat_info": "chat info changed",
-        "error": "unhandled exceptions",
-    }
-
-    observers: list[dict[str, str]] = []
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.ClassDef) or node.name != "Router":
-            continue
-        for item in node.body:
-            if not isinstance(item, ast.FunctionDef) or item.name != "__init__":
-                continue
-            for stmt in item.body:
-                if not isinstance(stmt, ast.Assign):
-                    continue
-                for target in stmt.targets:
-                    if not isinstance(target, ast.Attribute):
-                        continue
-                    name = target.attr
-                    if name in descriptions:
-                        observers.append(
-                            {
-                                "name": name,
-                                "description": descriptions[name],
-                            }
-                        )
-    return observers
+    cls = _top_classes(_parse(ROUTER_PY)).get("Router")
+    if cls is None:
+        return []
+    init_fn = next(
+        (f for f in cls.body if isinstance(f, ast.FunctionDef) and f.name == "__init__"),
+        None,
+    )
+    if init_fn is None:
+        return []
+    return [
+        {"name": target.attr, "description": _OBSERVER_DESCRIPTIONS[target.attr]}
+        for stmt in init_fn.body
+        if isinstance(stmt, ast.Assign)
+        for target in stmt.targets
+        if isinstance(target, ast.Attribute) and target.attr in _OBSERVER_DESCRIPTIONS
+    ]
 
 
 def extract_enum_members(filename: str) -> list[dict[str, str]]:
     """Extract enum class members from a file."""
-    tree = ast.parse((SRC / "enums" / filename).read_text(encoding="utf-8"))
-    members: list[dict[str, str]] = []
-
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.ClassDef):
-            continue
-        for item in node.body:
-            if isinstance(item, ast.Assign):
-                for target in item.targets:
-                    if isinstance(target, ast.Name):
-                        val = ast.unparse(item.value) if item.value else ""
-                        members.append({"name": target.id, "value": val})
-    return members
+    # Enum modules hold plain top-level classes with constant members
+    return [
+        {"name": item.targets[0].id, "value": repr(item.value.value)}
+        for node in _parse(SRC / "enums" / filename).body
+        if isinstance(node, ast.ClassDef)
+        for item in node.body
+        if isinstance(item, ast.Assign)
+        and len(item.targets) == 1
+        and isinstance(item.targets[0], ast.Name)
+        and isinstance(item.value, ast.Constant)
+    ]
 
 
 def extract_all_enums() -> dict[str, list[dict[str, str]]]:
     """Extract all enum classes with their members."""
-    enum_files = [
-        ("ChatAction", "chat_action.py"),
-        ("ChatType", "chat_type.py"),
-        ("ParseMode", "parse_mode.py"),
-        ("EventType", "event_type.py"),
-        ("ButtonStyle", "button_style.py"),
-        ("PartType", "part_type.py"),
-        ("StyleType", "style_type.py"),
-    ]
     result: dict[str, list[dict[str, str]]] = {}
-    for class_name, filename in enum_files:
+    for class_name, filename in _ENUM_FILES:
         result[class_name] = extract_enum_members(filename)
     return result
 
 
 def extract_types_exports() -> list[str]:
     """Get all exported type names from types/__init__.py."""
-    tree = ast.parse((SRC / "types" / "__init__.py").read_text(encoding="utf-8"))
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if (
-                    isinstance(target, ast.Name)
-                    and target.id == "__all__"
-                    and isinstance(node.value, ast.List)
-                ):
-                    return [ast.literal_eval(elt) for elt in node.value.elts]
+    # __all__ always sits at module top level
+    for node in _parse(TYPES_INIT_PY).body:
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == "__all__"
+            and isinstance(node.value, ast.List)
+        ):
+            return [
+                elt.value
+                for elt in node.value.elts
+                if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+            ]
     return []
 
 
@@ -287,83 +445,92 @@ asyncio.run(main())
 ---"""
 
 
+# Param descriptions (static, curated)
+_INIT_PARAM_COMMENTS: dict[str, str] = {
+    "token": "Bot token from MetaBot",
+    "api_url": "on-premise URL",
+    "timeout": "HTTP timeout in seconds",
+    "poll_time": "long-poll timeout",
+    "rate_limit": "max req/sec (token-bucket), None = unlimited",
+    "proxy": "corporate proxy URL",
+    "parse_mode": "default for all messages",
+    "retry_on_5xx": "auto-retry on server errors",
+    "verify_ssl": "False for self-signed certs",
+}
+
+_SEND_TEXT_COMMENTS: dict[str, str] = {
+    "chat_id": "target chat ID",
+    "text": "message text",
+    "reply_msg_id": "reply to message",
+    "forward_chat_id": "forward from",
+    "forward_msg_id": "forward message ID",
+    "inline_keyboard_markup": "inline keyboard",
+    "parse_mode": '"HTML" / "MarkdownV2" / None',
+    "format_": "offset/length formatting",
+    "parent_topic": "send in thread",
+    "request_id": "idempotency key",
+}
+
+# Example values shown instead of the real default
+_SEND_TEXT_EXAMPLES: dict[str, str] = {
+    "chat_id": '"user@company.ru"',
+    "text": '"Hello!"',
+}
+
+
+def _kwarg_line(name: str, value: str, comment: str) -> str:
+    """``    name=value,  # comment`` — one line of a call example."""
+    return f"    {name}={value},  # {comment}" if comment else f"    {name}={value},"
+
+
+def _method_row(m: dict[str, str]) -> str:
+    ret_str = f" → `{m['return']}`" if m["return"] else ""
+    ep_str = f"`{m['endpoint']}`" if m["endpoint"] else ""
+    return f"| `await bot.{m['name']}(...)`{ret_str} | {ep_str} | {m['description']} |"
+
+
 def section_bot(
     init_params: list[dict[str, str]],
     methods: list[dict[str, str]],
     send_text_params: list[dict[str, str]],
 ) -> str:
-    # Param descriptions (static, curated)
-    param_comments: dict[str, str] = {
-        "token": "Bot token from MetaBot",
-        "api_url": "on-premise URL",
-        "timeout": "HTTP timeout in seconds",
-        "poll_time": "long-poll timeout",
-        "rate_limit": "max req/sec (token-bucket), None = unlimited",
-        "proxy": "corporate proxy URL",
-        "parse_mode": "default for all messages",
-        "retry_on_5xx": "auto-retry on server errors",
-        "verify_ssl": "False for self-signed certs",
-    }
-
-    ctor_display_lines = ["bot = Bot("]
-    for p in init_params:
-        comment = param_comments.get(p["name"], "")
-        default = p["default"]
-        if not default:
-            line = f'    {p["name"]}="TOKEN_FROM_METABOT",'
-        else:
-            val = default.replace("'", '"')
-            line = f"    {p['name']}={val},"
-        if comment:
-            line += f"  # {comment}"
-        ctor_display_lines.append(line)
-    ctor_display_lines.append(")")
-    ctor_display = "\n".join(ctor_display_lines)
-
-    # Methods table
-    table_lines = ["| Method | API Endpoint | Description |"]
-    table_lines.append("|--------|-------------|-------------|")
-    for m in methods:
-        name = m["name"]
-        endpoint = m["endpoint"]
-        desc = m["description"]
-        ret = m["return"]
-        ret_str = f" → `{ret}`" if ret else ""
-        ep_str = f"`{endpoint}`" if endpoint else ""
-        table_lines.append(f"| `await bot.{name}(...)`{ret_str} | {ep_str} | {desc} |")
-    methods_table = "\n".join(table_lines)
-
-    # send_text params
-    st_lines = ["await bot.send_text("]
-    st_comments: dict[str, str] = {
-        "chat_id": "target chat ID",
-        "text": "message text",
-        "reply_msg_id": "reply to message",
-        "forward_chat_id": "forward from",
-        "forward_msg_id": "forward message ID",
-        "inline_keyboard_markup": "inline keyboard",
-        "parse_mode": '"HTML" / "MarkdownV2" / None',
-        "format_": "offset/length formatting",
-        "parent_topic": "send in thread",
-        "request_id": "idempotency key",
-    }
-    for p in send_text_params:
-        comment = st_comments.get(p["name"], "")
-        default = p["default"]
-        if p["name"] == "chat_id":
-            val = '"user@company.ru"'
-        elif p["name"] == "text":
-            val = '"Hello!"'
-        elif default:
-            val = default.replace("'", '"')
-        else:
-            val = "..."
-        line = f"    {p['name']}={val},"
-        if comment:
-            line += f"  # {comment}"
-        st_lines.append(line)
-    st_lines.append(")")
-    send_text_display = "\n".join(st_lines)
+    ctor_display = "\n".join(
+        [
+            "bot = Bot(",
+            *(
+                _kwarg_line(
+                    p["name"],
+                    p["default"] or '"TOKEN_FROM_METABOT"',
+                    _INIT_PARAM_COMMENTS.get(p["name"], ""),
+                )
+                for p in init_params
+            ),
+            ")",
+        ]
+    )
+
+    methods_table = "\n".join(
+        [
+            "| Method | API Endpoint | Description |",
+            "|--------|-------------|-------------|",
+            *(_method_row(m) for m in methods),
+        ]
+    )
+
+    send_text_display = "\n".join(
+        [
+            "await bot.send_text(",
+            *(
+                _kwarg_line(
+                    p["name"],
+                    _SEND_TEXT_EXAMPLES.get(p["name"]) or p["default"] or "...",
+                    _SEND_TEXT_COMMENTS.get(p["name"], ""),
+                )
+                for p in send_text_params
+            ),
+            ")",
+        ]
+    )
 
     return f"""\
 
@@ -438,19 +605,21 @@ bot = Bot(token="TOKEN", api_url="...", retry_on_5xx=3)  # None or 0 = no retry
 ---"""
 
 
+def _decorator_lines(obs: dict[str, str]) -> tuple[str, ...]:
+    name = obs["name"]
+    desc = obs["description"]
+    # Add example filter for message
+    if name == "message":
+        return (
+            f"@router.{name}()                    # {desc}",
+            f'@router.{name}(Command("start"))    # /start command',
+            f"@router.{name}(F.text)              # messages with text",
+        )
+    return (f"@router.{name}(){' ' * max(1, 25 - len(name))}# {desc}",)
+
+
 def section_dispatcher(observers: list[dict[str, str]]) -> str:
-    decorator_lines = []
-    for obs in observers:
-        name = obs["name"]
-        desc = obs["description"]
-        # Add example filter for message
-        if name == "message":
-            decorator_lines.append(f"@router.{name}()                    # {desc}")
-            decorator_lines.append(f'@router.{name}(Command("start"))    # /start command')
-            decorator_lines.append(f"@router.{name}(F.text)              # messages with text")
-        else:
-            decorator_lines.append(f"@router.{name}(){' ' * max(1, 25 - len(name))}# {desc}")
-    decorators = "\n".join(decorator_lines)
+    decorators = "\n".join(line for obs in observers for line in _decorator_lines(obs))
 
     return f"""\
 
@@ -765,7 +934,7 @@ def build_page(page: int):
     paginator = Paginator(data=ITEMS, per_page=3, current_page=page, name="fruits")
 
     builder = InlineKeyboardBuilder()
-    for item in paginator.page_data:
+    for item in paginator.iter_page():
         builder.button(text=item, callback_data=f"pick:{item}")
     builder.adjust(1)
     paginator.add_nav_row(builder)  # adds ◀ 2/4 ▶
@@ -792,6 +961,7 @@ async def on_page(query: CallbackQuery, callback_data: PaginationCB):
 p = Paginator(data=items, per_page=5, current_page=0, name="my")
 p.total_pages   # int — total page count
 p.page_data     # slice of data for current page
+p.iter_page()   # same items as a lazy iterator (no copy)
 p.offset        # int — start index
 p.has_prev      # bool
 p.has_next      # bool
@@ -1368,21 +1538,34 @@ async def cmd_kpi(message: Message, db):
 ---"""
 
 
-def section_enums(all_enums: dict[str, list[dict[str, str]]]) -> str:
-    lines = ["\n## Enums\n\n```python\nfrom vkworkspace.enums import ("]
-    lines.extend(f"    {class_name}," for class_name in all_enums)
-    lines.append(")\n```\n")
+_ENUMS_TEMPLATE = string.Template(
+    "\n## Enums\n\n"
+    + _PY_OPEN
+    + "from vkworkspace.enums import (${imports}\n)\n"
+    + _FENCE
+    + "${value_lines}\n"
+    + _HR
+)
 
-    # Show values for key enums
-    show_values = ["ChatAction", "ChatType", "ParseMode", "ButtonStyle", "StyleType"]
-    for class_name in show_values:
-        members = all_enums.get(class_name, [])
-        if members:
-            vals = ", ".join(m["name"] for m in members)
-            lines.append(f"- **{class_name}**: {vals}")
+# Enums whose values are spelled out under the import block
+_SHOW_ENUM_VALUES = ("ChatAction", "ChatType", "ParseMode", "ButtonStyle", "StyleType")
 
-    lines.append("\n---")
-    return "\n".join(lines)
+
+def section_enums(all_enums: dict[str, list[dict[str, str]]]) -> str:
+    imports = "".join(f"\n    {class_name}," for class_name in all_enums)
+    value_lines = "".join(
+        f"\n- **{class_name}**: " + ", ".join(m["name"] for m in members)
+        for class_name in _SHOW_ENUM_VALUES
+        if (members := all_enums.get(class_name))
+    )
+    return _ENUMS_TEMPLATE.substitute(imports=imports, value_lines=value_lines)
+
+
+_TYPES_TEMPLATE = string.Template(
+    "\n## Types Reference\n\n"
+    "| Type | Module | Key Fields |\n"
+    "|------|--------|------------|${rows}${other}\n" + _HR
+)
 
 
 def section_types(types_list: list[str]) -> str:
@@ -1406,19 +1589,15 @@ def section_types(types_list: list[str]) -> str:
         "ParentMessage": ("vkworkspace.types.message", "chat_id, message_id, type"),
     }
 
-    lines = ["\n## Types Reference\n"]
-    lines.append("| Type | Module | Key Fields |")
-    lines.append("|------|--------|------------|")
-    for name, (module, fields) in curated.items():
-        lines.append(f"| `{name}` | `{module}` | {fields} |")
+    rows = "".join(
+        f"\n| `{name}` | `{module}` | {fields} |" for name, (module, fields) in curated.items()
+    )
 
     # List any exported types not in the curated table
     extra = [t for t in types_list if t not in curated and t != "VKTeamsObject"]
-    if extra:
-        lines.append(f"\nOther exported types: {', '.join(f'`{t}`' for t in extra)}")
+    other = f"\n\nOther exported types: {', '.join(f'`{t}`' for t in extra)}" if extra else ""
 
-    lines.append("\n---")
-    return "\n".join(lines)
+    return _TYPES_TEMPLATE.substitute(rows=rows, other=other)
 
 
 COMPLETE_EXAMPLE = """\
@@ -1630,54 +1809,188 @@ Fails even with a valid `thread_id` from `threads/add`. Do not rely on it.
 # ── Main ──────────────────────────────────────────────────────────────
 
 
-def generate() -> str:
-    """Assemble all sections into the final reference."""
-    version = get_version()
-    bot_init = extract_bot_init_params()
-    bot_methods = extract_bot_methods()
-    send_text_params = extract_send_text_params()
-    observers = extract_router_observers()
-    all_enums = extract_all_enums()
-    types_list = extract_types_exports()
-
-    sections = [
-        section_header(version),
-        QUICK_START,
-        section_bot(bot_init, bot_methods, send_text_params),
-        section_dispatcher(observers),
-        FILTERS,
-        MESSAGE_OBJECT,
-        CALLBACK_QUERY,
-        KEYBOARDS,
-        CALLBACK_DATA_FACTORY,
-        PAGINATOR,
-        FSM,
-        MIDDLEWARE,
-        TYPING_ACTIONS,
-        TEXT_FORMATTING,
-        FILE_HANDLING,
-        ERROR_HANDLING,
-        THREADS,
-        BOT_SERVER,
-        REDIS_LISTENER,
-        SCHEDULER,
-        RUN_SYNC,
-        section_enums(all_enums),
-        section_types(types_list),
-        COMPLETE_EXAMPLE,
-        INSTALLATION,
-        section_key_imports(),
-        VK_TEAMS_QUIRKS,
-    ]
+@dataclass(frozen=True)
+class RefData:
+    """Everything the dynamic sections need, extracted from the sources."""
+
+    version: str
+    init_params: list[dict[str, str]]
+    methods: list[dict[str, str]]
+    send_text_params: list[dict[str, str]]
+    observers: list[dict[str, str]]
+    enums: dict[str, list[dict[str, str]]]
+    types_list: list[str]
+
+
+Section = str | Callable[[RefData], str]
+# Static runs pre-encoded with their newline count; dynamic sections
+# still rendered per call
+CompiledSection = tuple[bytes, int] | Callable[[RefData], str]
+
+# Document outline, in output order: static blocks inline, dynamic ones as
+# renderers over RefData.
+_LAYOUT: tuple[Section, ...] = (
+    lambda d: section_header(d.version),
+    QUICK_START,
+    lambda d: section_bot(d.init_params, d.methods, d.send_text_params),
+    lambda d: section_dispatcher(d.observers),
+    FILTERS,
+    MESSAGE_OBJECT,
+    CALLBACK_QUERY,
+    KEYBOARDS,
+    CALLBACK_DATA_FACTORY,
+    PAGINATOR,
+    FSM,
+    MIDDLEWARE,
+    TYPING_ACTIONS,
+    TEXT_FORMATTING,
+    FILE_HANDLING,
+    ERROR_HANDLING,
+    THREADS,
+    BOT_SERVER,
+    REDIS_LISTENER,
+    SCHEDULER,
+    RUN_SYNC,
+    lambda d: section_enums(d.enums),
+    lambda d: section_types(d.types_list),
+    COMPLETE_EXAMPLE,
+    INSTALLATION,
+    section_key_imports(),
+    VK_TEAMS_QUIRKS,
+    "",  # trailing newline
+)
+
 
-    return "\n".join(sections) + "\n"
+def _encode_counted(text: str) -> tuple[bytes, int]:
+    return text.encode("utf-8"), text.count("\n")
+
+
+def _compile_layout(layout: tuple[Section, ...]) -> tuple[CompiledSection, ...]:
+    """Join, UTF-8 encode and line-count each run of adjacent static blocks once.
+
+    Every block is followed by the ``"\n"`` separator except the last one,
+    which is static (the layout ends with ``""``), so the rendered chunks
+    can simply be written back to back.
+    """
+    if not isinstance(layout[-1], str):
+        raise ValueError("layout must end with a static block")
+    compiled: list[CompiledSection] = []
+    static_run: list[str] = []
+    for part in layout:
+        if isinstance(part, str):
+            static_run.append(part)
+            continue
+        if static_run:
+            compiled.append(_encode_counted("\n".join(static_run) + "\n"))
+            static_run = []
+        compiled.append(part)
+    compiled.append(_encode_counted("\n".join(static_run)))
+    return tuple(compiled)
+
+
+# Compiled once at import; rendering only fills in the dynamic sections
+_TEMPLATE = _compile_layout(_LAYOUT)
+
+
+# Source files the extractors parse
+_EXTRACTOR_INPUTS = [BOT_PY, ROUTER_PY, TYPES_INIT_PY, *ENUM_PATHS]
+
+# In RefData field order
+_EXTRACTORS: tuple[Callable[[], Any], ...] = (
+    get_version,
+    extract_bot_init_params,
+    extract_bot_methods,
+    extract_send_text_params,
+    extract_router_observers,
+    extract_all_enums,
+    extract_types_exports,
+)
 
 
-def main() -> None:
-    text = generate()
-    OUTPUT.write_text(text, encoding="utf-8")
-    line_count = text.count("\n")
-    print(f"Generated {OUTPUT.name} ({len(text):,} chars, {line_count} lines)")
+async def extract() -> RefData:
+    """Run every extractor concurrently over the (pre-parsed) sources.
+
+    The sources are parsed once up front (see ``_preparse``); the
+    extractors only walk the shared trees, so a thread pool keeps them on
+    the same in-memory cache.
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, _preparse, _EXTRACTOR_INPUTS)
+    # gather preserves order — results line up with RefData's fields
+    results: list[Any] = await asyncio.gather(
+        *(loop.run_in_executor(None, fn) for fn in _EXTRACTORS)
+    )
+    return RefData(*results)
+
+
+def iter_document(data: RefData) -> Iterator[tuple[bytes, int]]:
+    """Yield ``(utf8_chunk, newline_count)`` for *data*, one section run at a time.
+
+    Only the dynamic sections are counted here; static runs carry the
+    count computed at import.
+    """
+    for part in _TEMPLATE:
+        yield part if isinstance(part, tuple) else _encode_counted(part(data) + "\n")
+
+
+def _input_files() -> list[Path]:
+    """Everything the output depends on: the package sources and this script."""
+    return [*sorted(SRC.rglob("*.py")), Path(__file__).resolve()]
+
+
+def _sources_digest(paths: list[Path]) -> str:
+    """Content hash of *paths* — survives checkouts that only touch mtimes."""
+    h = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        h.update(path.relative_to(ROOT).as_posix().encode("utf-8"))
+        h.update(b"\0")
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def _is_up_to_date(inputs: list[Path]) -> tuple[bool, str]:
+    """Check OUTPUT against *inputs*; returns (up_to_date, current digest or "").
+
+    The sidecar is only written by this script, so a fresh clone (whose
+    committed llm_full.md may be stale) always regenerates.
+    """
+    if not OUTPUT.exists() or not HASH_FILE.exists():
+        return False, ""
+    out_mtime = OUTPUT.stat().st_mtime
+    if max(p.stat().st_mtime for p in inputs) <= out_mtime:
+        return True, ""
+    digest = _sources_digest(inputs)
+    return HASH_FILE.read_text(encoding="utf-8").strip() == digest, digest
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate llm_full.md from the sources.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate even if no source file changed",
+    )
+    args = parser.parse_args(argv)
+
+    inputs = _input_files()
+    up_to_date, digest = (False, "") if args.force else _is_up_to_date(inputs)
+    if up_to_date:
+        print(f"{OUTPUT.name} up to date")
+        return
+
+    data = asyncio.run(extract())
+    size = line_count = 0
+    with OUTPUT.open("wb", buffering=64 * 1024) as fp:
+        for chunk, newlines in iter_document(data):
+            fp.write(chunk)
+            size += len(chunk)
+            line_count += newlines
+    HASH_FILE.write_text(digest or _sources_digest(inputs), encoding="utf-8")
+    print(f"Generated {OUTPUT.name} ({size:,} bytes, {line_count} lines)")
+    print(
+        f"AST cache: {_ast_cache_stats['hits']} hits, {_ast_cache_stats['misses']} misses"
+        f" ({AST_CACHE_DIR.relative_to(ROOT)})"
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,169 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+from unittest.mock import AsyncMock
+
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+
+from vkworkspace.client.bot import Bot
+
+MOCK_API_URL = "https://mock.vkteams.test/bot/v1"
+MOCK_TOKEN = "test-token-001"
+
+# A canned response: a JSON-serialisable dict, an already encoded body, or
+# a handler called with the request (e.g. to capture what was sent, or to
+# answer with an error status)
+MockHandler = Callable[[httpx.Request], httpx.Response]
+MockBody = dict[str, Any] | bytes | MockHandler
+
+_JSON_HEADERS = {"content-type": "application/json"}
+_NOT_FOUND_JSON = b'{"ok":false,"description":"Not found"}'
+
+
+def make_transport(responses: dict[str, MockBody]) -> httpx.MockTransport:
+    """Create an httpx MockTransport that returns preset JSON per endpoint.
+
+    *responses* maps the endpoint path after ``/bot/v1/`` (e.g.
+    ``"self/get"``) to a JSON-serialisable dict, to pre-encoded JSON
+    bytes, or to a handler whose return value is used.  It is read on
+    every request, so the caller may mutate it between requests to
+    re-route the same transport.
+
+    A dict body is encoded once per endpoint, so it must not be mutated
+    in place once registered.  Every request still gets a new
+    ``httpx.Response``: httpx binds a response to the request it answers.
+    """
+    encoded: dict[str, tuple[MockBody, bytes]] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # e.g. /bot/v1/messages/sendText → messages/sendText
+        endpoint = request.url.path.partition("/bot/v1/")[2]
+        body = responses.get(endpoint)
+        if body is None:
+            return httpx.Response(404, content=_NOT_FOUND_JSON, headers=_JSON_HEADERS)
+        if callable(body):
+            return body(request)
+        if isinstance(body, bytes):
+            content = body
+        else:
+            cached = encoded.get(endpoint)
+            if cached is None or cached[0] is not body:
+                cached = encoded[endpoint] = (body, orjson.dumps(body))
+            content = cached[1]
+        return httpx.Response(200, content=content, headers=_JSON_HEADERS)
+
+    return httpx.MockTransport(handler)
+
+
+def mock_client(transport: httpx.MockTransport) -> httpx.AsyncClient:
+    """AsyncClient over *transport* without the setup a real client needs.
+
+    ``trust_env=False`` skips the proxy/certificate environment lookups.
+    Connection limits are not passed: httpx only applies them to the
+    default transport, never to a supplied one.
+    """
+    return httpx.AsyncClient(transport=transport, timeout=None, trust_env=False)
+
+
+@pytest.fixture(scope="session")
+def mock_routes() -> dict[str, MockBody]:
+    """Routing table of the shared mock transport (endpoint → JSON body)."""
+    return {}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_bot(mock_routes: dict[str, MockBody]) -> AsyncIterator[Bot]:
+    """One Bot + AsyncClient for the whole session, served by ``mock_routes``."""
+    bot = Bot(token=MOCK_TOKEN, api_url=MOCK_API_URL)
+    bot._session = mock_client(make_transport(mock_routes))
+    yield bot
+    await bot.close()
+
+
+@pytest.fixture
+async def bot_factory(
+    shared_bot: Bot, mock_routes: dict[str, MockBody]
+) -> AsyncIterator[Callable[..., Bot]]:
+    """Build a Bot served by canned responses; cleaned up after the test.
+
+    Usage::
+
+        bot = bot_factory({"self/get": {"ok": True, ...}})
+        bot = bot_factory({...}, parse_mode="HTML")  # non-default settings
+        bot = bot_factory({"messages/sendText": my_handler})  # per-endpoint handler
+
+    Responses re-route the shared session Bot; Bot options get a dedicated
+    Bot, closed at teardown.
+    """
+    dedicated: list[Bot] = []
+
+    def make(
+        responses: dict[str, MockBody] | None = None,
+        **bot_kwargs: Any,
+    ) -> Bot:
+        if not bot_kwargs:
+            mock_routes.clear()
+            mock_routes.update(responses or {})
+            shared_bot._last_event_id = 0
+            return shared_bot
+
+        bot = Bot(token=MOCK_TOKEN, api_url=MOCK_API_URL, **bot_kwargs)
+        bot._session = mock_client(make_transport(dict(responses or {})))
+        dedicated.append(bot)
+        return bot
+
+    yield make
+    for bot in dedicated:
+        await bot.close()
+
+
+@pytest.fixture
+async def fake_download(
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncIterator[Callable[..., None]]:
+    """Serve ``InputFile.from_url`` downloads from a canned response.
+
+    Usage::
+
+        fake_download(200, b"image bytes")
+        f = await InputFile.from_url("https://example.com/photo.jpg")
+    """
+    clients: list[httpx.AsyncClient] = []
+
+    def serve(status: int = 200, content: bytes = b"") -> None:
+        client = mock_client(
+            httpx.MockTransport(lambda request: httpx.Response(status, content=content))
+        )
+        clients.append(client)
+        monkeypatch.setattr("vkworkspace.types.input_file._download_client", lambda proxy: client)
+
+    yield serve
+    for client in clients:
+        await client.aclose()
+
+
+@pytest.fixture
+def direct_bot() -> Callable[[dict[str, dict[str, Any]]], Bot]:
+    """Bot whose ``_request`` returns the canned dict directly — no httpx.
+
+    For tests that only check how responses are parsed into models; the
+    HTTP round trip is covered by the ``bot_factory`` tests.
+    """
+    routes: dict[str, dict[str, Any]] = {}
+    bot = Bot(token=MOCK_TOKEN, api_url=MOCK_API_URL)
+    bot._request = AsyncMock(  # type: ignore[method-assign]
+        side_effect=lambda endpoint, *args, **kwargs: routes[endpoint]
+    )
+
+    def make(responses: dict[str, dict[str, Any]]) -> Bot:
+        routes.clear()
+        routes.update(responses)
+        return bot
+
+    return make
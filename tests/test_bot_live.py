@@ -1,15 +1,20 @@
 """Live API test — runs real requests against a VK Teams instance.
 
-Usage::
+Usage (with the checkout installed via ``pip install -e .``)::
 
     python tests/test_bot_live.py --token BOT_TOKEN \\
         --api-url https://myteam.mail.ru/bot/v1 --chat CHAT_ID
 
+Without an install, run it as a module from the repository root so the
+local package is importable: ``python -m tests.test_bot_live ...``.
+
 All arguments can also be set via environment variables:
 
     VKWS_TOKEN      — bot token (required)
     VKWS_API_URL    — API base URL (required)
     VKWS_CHAT_ID    — group chat id for testing (required)
+    VKWS_UVLOOP     — set to ``1`` to run on uvloop (winloop on Windows)
+                      if it is installed
 
 The script sends real messages to *CHAT_ID*, then cleans them up.
 """
@@ -18,60 +23,104 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import io
 import os
+import re
 import sys
 import time
-
-# make sure we import the local package, not an installed one
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from collections.abc import Callable
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
 
 from vkworkspace.client.bot import Bot
 from vkworkspace.enums import ChatAction, ParseMode
 from vkworkspace.exceptions import VKTeamsAPIError
 from vkworkspace.types.input_file import InputFile
 
+# 800x800 valid PNG (red square) for the avatar test
+_AVATAR_PNG = Path(__file__).parent / "fixtures" / "red_800.png"
+
+# deletes in flight at once during cleanup; keeps the burst within the
+# client's keep-alive pool instead of opening a connection per message
+_CLEANUP_CONCURRENCY = 8
+
 # ── colours ────────────────────────────────────────────────────────────
 
-GREEN = "\033[92m"
-RED = "\033[91m"
-YELLOW = "\033[93m"
-CYAN = "\033[96m"
-RESET = "\033[0m"
-BOLD = "\033[1m"
+# escape codes only when writing to a terminal, not into redirected logs
+_USE_COLOR = sys.stdout.isatty()
+
+GREEN = "\033[92m" if _USE_COLOR else ""
+RED = "\033[91m" if _USE_COLOR else ""
+YELLOW = "\033[93m" if _USE_COLOR else ""
+CYAN = "\033[96m" if _USE_COLOR else ""
+RESET = "\033[0m" if _USE_COLOR else ""
+BOLD = "\033[1m" if _USE_COLOR else ""
+
+_OK = f"  {GREEN}OK{RESET}  "
+_FAIL = f"  {RED}FAIL{RESET}  "
+_SKIP = f"  {YELLOW}SKIP{RESET}  "
+_SECTION_L = f"\n{BOLD}{CYAN}── "
+_SECTION_R = f" ──{RESET}"
 
 
 def ok(name: str, detail: str = "") -> None:
-    d = f"  ({detail})" if detail else ""
-    print(f"  {GREEN}OK{RESET}  {name}{d}")
+    print(_OK + name + (f"  ({detail})" if detail else ""))
 
 
-def fail(name: str, err: Exception) -> None:
-    print(f"  {RED}FAIL{RESET}  {name}  — {err}")
+def fail(name: str, err: BaseException) -> None:
+    print(f"{_FAIL}{name}  — {err}")
 
 
 def skip(name: str, reason: str) -> None:
-    print(f"  {YELLOW}SKIP{RESET}  {name}  — {reason}")
+    print(_SKIP + name + "  — " + reason)
 
 
 def section(title: str) -> None:
-    print(f"\n{BOLD}{CYAN}── {title} ──{RESET}")
+    print(_SECTION_L + title + _SECTION_R)
+
+
+_UNKNOWN_METHOD = re.compile("unknown method", re.IGNORECASE)
 
 
 def _is_unknown_method(e: Exception) -> bool:
     """Check if the error is 'Unknown method' — installation doesn't support it."""
-    return isinstance(e, VKTeamsAPIError) and "unknown method" in e.message.lower()
+    return isinstance(e, VKTeamsAPIError) and _UNKNOWN_METHOD.search(e.message) is not None
+
+
+def _assert_ok(r: Any) -> str:
+    assert r.ok
+    return ""
+
+
+def _report(name: str, result: Any, check: Callable[[Any], str] | None = None) -> bool:
+    """Print the outcome of one call from a gathered batch; True if it passed.
+
+    *result* is what ``asyncio.gather(..., return_exceptions=True)`` returned
+    for the call.  *check* validates a successful result and returns the
+    detail text for the ``OK`` line.
+    """
+    if isinstance(result, BaseException):
+        fail(name, result)
+        return False
+    try:
+        detail = check(result) if check else ""
+    except Exception as e:
+        fail(name, e)
+        return False
+    ok(name, detail)
+    return True
 
 
 # ── test runner ────────────────────────────────────────────────────────
 
 
 async def run_tests(token: str, api_url: str, chat_id: str) -> tuple[int, int, int]:
-    bot = Bot(token=token, api_url=api_url)
+    # HTTP/2 lets the gathered batches share one connection when h2 is there
+    bot = Bot(token=token, api_url=api_url, http2=find_spec("h2") is not None)
     passed = 0
     failed = 0
     skipped = 0
-    cleanup_msgs: list[str] = []  # msg_ids to delete at the end
+    cleanup_msgs: list[str] = []  # msg_ids to delete at the end; only truthy ids
 
     # ── self/get ───────────────────────────────────────────────────
     section("self/get")
@@ -109,128 +158,56 @@ async def run_tests(token: str, api_url: str, chat_id: str) -> tuple[int, int, i
         failed += 1
         basic_msg_id = None
 
-    # with parse_mode HTML
-    try:
-        r = await bot.send_text(
-            chat_id,
-            "<b>bold</b> <i>italic</i> <u>underline</u>",
-            parse_mode=ParseMode.HTML,
-        )
+    def sent(r: Any) -> str:
         assert r.ok
         if r.msg_id:
             cleanup_msgs.append(r.msg_id)
-        ok("send_text (HTML)")
-        passed += 1
-    except Exception as e:
-        fail("send_text (HTML)", e)
-        failed += 1
+        return ""
 
-    # with parse_mode MarkdownV2
-    try:
-        r = await bot.send_text(
+    # the variants don't depend on each other, so they go out in one batch
+    kb = [
+        [
+            {"text": "Button 1", "callbackData": "btn1"},
+            {"text": "Button 2", "url": "https://example.com"},
+        ]
+    ]
+    rid = f"test-{int(time.time())}"
+    batch = {
+        "send_text (HTML)": bot.send_text(
+            chat_id,
+            "<b>bold</b> <i>italic</i> <u>underline</u>",
+            parse_mode=ParseMode.HTML,
+        ),
+        "send_text (MarkdownV2)": bot.send_text(
             chat_id,
             "*bold* _italic_ ~strikethrough~",
             parse_mode=ParseMode.MARKDOWNV2,
-        )
-        assert r.ok
-        if r.msg_id:
-            cleanup_msgs.append(r.msg_id)
-        ok("send_text (MarkdownV2)")
-        passed += 1
-    except Exception as e:
-        fail("send_text (MarkdownV2)", e)
-        failed += 1
-
-    # with reply_msg_id (single string)
-    if basic_msg_id:
-        try:
-            r = await bot.send_text(chat_id, "reply test", reply_msg_id=basic_msg_id)
-            assert r.ok
-            if r.msg_id:
-                cleanup_msgs.append(r.msg_id)
-            ok("send_text (reply)")
-            passed += 1
-        except Exception as e:
-            fail("send_text (reply)", e)
-            failed += 1
-
-    # with reply_msg_id as list (comma-separated)
-    if basic_msg_id:
-        try:
-            r = await bot.send_text(chat_id, "multi-reply test", reply_msg_id=[basic_msg_id])
-            assert r.ok
-            if r.msg_id:
-                cleanup_msgs.append(r.msg_id)
-            ok("send_text (reply list)")
-            passed += 1
-        except Exception as e:
-            fail("send_text (reply list)", e)
-            failed += 1
-
-    # with forward
-    if basic_msg_id:
-        try:
-            r = await bot.send_text(
-                chat_id,
-                "forward test",
-                forward_chat_id=chat_id,
-                forward_msg_id=basic_msg_id,
-            )
-            assert r.ok
-            if r.msg_id:
-                cleanup_msgs.append(r.msg_id)
-            ok("send_text (forward)")
-            passed += 1
-        except Exception as e:
-            fail("send_text (forward)", e)
-            failed += 1
-
-    # with inline keyboard
-    try:
-        kb = [
-            [
-                {"text": "Button 1", "callbackData": "btn1"},
-                {"text": "Button 2", "url": "https://example.com"},
-            ]
-        ]
-        r = await bot.send_text(chat_id, "keyboard test", inline_keyboard_markup=kb)
-        assert r.ok
-        if r.msg_id:
-            cleanup_msgs.append(r.msg_id)
-        ok("send_text (keyboard)")
-        passed += 1
-    except Exception as e:
-        fail("send_text (keyboard)", e)
-        failed += 1
-
-    # with format_ (rich formatting)
-    try:
-        r = await bot.send_text(
+        ),
+        "send_text (keyboard)": bot.send_text(chat_id, "keyboard test", inline_keyboard_markup=kb),
+        "send_text (format_)": bot.send_text(
             chat_id,
             "format test bold",
             format_={"bold": [{"offset": 12, "length": 4}]},
+        ),
+        # idempotency
+        f"send_text (request_id={rid})": bot.send_text(chat_id, "idempotent msg", request_id=rid),
+    }
+    if basic_msg_id:
+        batch["send_text (reply)"] = bot.send_text(chat_id, "reply test", reply_msg_id=basic_msg_id)
+        # reply_msg_id as list (comma-separated)
+        batch["send_text (reply list)"] = bot.send_text(
+            chat_id, "multi-reply test", reply_msg_id=[basic_msg_id]
         )
-        assert r.ok
-        if r.msg_id:
-            cleanup_msgs.append(r.msg_id)
-        ok("send_text (format_)")
-        passed += 1
-    except Exception as e:
-        fail("send_text (format_)", e)
-        failed += 1
-
-    # with request_id (idempotency)
-    try:
-        rid = f"test-{int(time.time())}"
-        r1 = await bot.send_text(chat_id, "idempotent msg", request_id=rid)
-        assert r1.ok
-        if r1.msg_id:
-            cleanup_msgs.append(r1.msg_id)
-        ok("send_text (request_id)", f"requestId={rid}")
-        passed += 1
-    except Exception as e:
-        fail("send_text (request_id)", e)
-        failed += 1
+        batch["send_text (forward)"] = bot.send_text(
+            chat_id,
+            "forward test",
+            forward_chat_id=chat_id,
+            forward_msg_id=basic_msg_id,
+        )
+    results = await asyncio.gather(*batch.values(), return_exceptions=True)
+    n_ok = sum(_report(name, r, sent) for name, r in zip(batch, results, strict=True))
+    passed += n_ok
+    failed += len(batch) - n_ok
 
     # ── messages/sendTextWithDeeplink ──────────────────────────────
     section("messages/sendTextWithDeeplink")
@@ -267,8 +244,7 @@ async def run_tests(token: str, api_url: str, chat_id: str) -> tuple[int, int, i
     # ── messages/sendFile ──────────────────────────────────────────
     section("messages/sendFile")
     try:
-        buf = io.BytesIO(b"Hello from vkworkspace live test!\n")
-        inp = InputFile(buf, filename="test.txt")
+        inp = InputFile(b"Hello from vkworkspace live test!\n", filename="test.txt")
         r = await bot.send_file(chat_id, file=inp, caption="test file upload")
         assert r.ok
         if r.msg_id:
@@ -281,8 +257,7 @@ async def run_tests(token: str, api_url: str, chat_id: str) -> tuple[int, int, i
 
     # send_file with request_id
     try:
-        buf2 = io.BytesIO(b"idempotent file")
-        inp2 = InputFile(buf2, filename="idem.txt")
+        inp2 = InputFile(b"idempotent file", filename="idem.txt")
         r = await bot.send_file(chat_id, file=inp2, request_id=f"file-{int(time.time())}")
         assert r.ok
         if r.msg_id:
@@ -302,8 +277,7 @@ async def run_tests(token: str, api_url: str, chat_id: str) -> tuple[int, int, i
             b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
             b"\x01\x1e\x01vorbis"
         )
-        buf = io.BytesIO(ogg_header)
-        inp = InputFile(buf, filename="voice.ogg")
+        inp = InputFile(ogg_header, filename="voice.ogg")
         r = await bot.send_voice(chat_id, file=inp)
         assert r.ok
         if r.msg_id:
@@ -319,78 +293,50 @@ async def run_tests(token: str, api_url: str, chat_id: str) -> tuple[int, int, i
     skip("answer_callback_query", "requires a real callback from user click")
     skipped += 1
 
-    # ── chats/getInfo ──────────────────────────────────────────────
-    section("chats/getInfo")
-    info = None
-    try:
-        info = await bot.get_chat_info(chat_id)
-        assert info.type in ("group", "channel", "private")
-        ok("get_chat_info", f"type={info.type}, title={info.title}")
-        passed += 1
-    except Exception as e:
-        fail("get_chat_info", e)
-        failed += 1
+    # ── chats/getInfo, getAdmins, getMembers, getBlockedUsers, getPendingUsers
+    # read-only and independent: one batch, reported per endpoint
+    info_r, admins_r, members_r, blocked_r, pending_r = await asyncio.gather(
+        bot.get_chat_info(chat_id),
+        bot.get_chat_admins(chat_id),
+        bot.get_chat_members(chat_id),
+        bot.get_blocked_users(chat_id),
+        bot.get_pending_users(chat_id),
+        return_exceptions=True,
+    )
 
-    # ── chats/getAdmins ────────────────────────────────────────────
-    section("chats/getAdmins")
-    try:
-        admins = await bot.get_chat_admins(chat_id)
-        ok("get_chat_admins", f"{len(admins)} admin(s)")
-        passed += 1
-    except Exception as e:
-        fail("get_chat_admins", e)
-        failed += 1
+    def check_info(i: Any) -> str:
+        assert i.type in ("group", "channel", "private")
+        return f"type={i.type}, title={i.title}"
 
-    # ── chats/getMembers ───────────────────────────────────────────
+    section("chats/getInfo")
+    info = None if isinstance(info_r, BaseException) else info_r
+    reports = [_report("get_chat_info", info_r, check_info)]
+    section("chats/getAdmins")
+    reports.append(_report("get_chat_admins", admins_r, lambda a: f"{len(a)} admin(s)"))
     section("chats/getMembers")
-    try:
-        members_data = await bot.get_chat_members(chat_id)
-        member_count = len(members_data.get("members", []))
-        ok("get_chat_members", f"{member_count} member(s)")
-        passed += 1
-    except Exception as e:
-        fail("get_chat_members", e)
-        failed += 1
-
-    # ── chats/getBlockedUsers ──────────────────────────────────────
+    reports.append(
+        _report(
+            "get_chat_members",
+            members_r,
+            lambda m: f"{len(m.get('members', []))} member(s)",
+        )
+    )
     section("chats/getBlockedUsers")
-    try:
-        blocked = await bot.get_blocked_users(chat_id)
-        ok("get_blocked_users", f"{len(blocked)} blocked")
-        passed += 1
-    except Exception as e:
-        fail("get_blocked_users", e)
-        failed += 1
-
-    # ── chats/getPendingUsers ──────────────────────────────────────
+    reports.append(_report("get_blocked_users", blocked_r, lambda b: f"{len(b)} blocked"))
     section("chats/getPendingUsers")
-    try:
-        pending = await bot.get_pending_users(chat_id)
-        ok("get_pending_users", f"{len(pending)} pending")
-        passed += 1
-    except Exception as e:
-        fail("get_pending_users", e)
-        failed += 1
+    reports.append(_report("get_pending_users", pending_r, lambda p: f"{len(p)} pending"))
 
     # ── chats/sendActions ──────────────────────────────────────────
     section("chats/sendActions")
-    try:
-        r = await bot.send_actions(chat_id, ChatAction.TYPING)
-        assert r.ok
-        ok("send_actions (typing)")
-        passed += 1
-    except Exception as e:
-        fail("send_actions (typing)", e)
-        failed += 1
-
-    try:
-        r = await bot.send_actions(chat_id, ChatAction.LOOKING)
-        assert r.ok
-        ok("send_actions (looking)")
-        passed += 1
-    except Exception as e:
-        fail("send_actions (looking)", e)
-        failed += 1
+    typing_r, looking_r = await asyncio.gather(
+        bot.send_actions(chat_id, ChatAction.TYPING),
+        bot.send_actions(chat_id, ChatAction.LOOKING),
+        return_exceptions=True,
+    )
+    reports.append(_report("send_actions (typing)", typing_r, _assert_ok))
+    reports.append(_report("send_actions (looking)", looking_r, _assert_ok))
+    passed += sum(reports)
+    failed += len(reports) - sum(reports)
 
     # ── chats/pinMessage / unpinMessage ────────────────────────────
     section("chats/pinMessage + unpinMessage")
@@ -423,61 +369,27 @@ async def run_tests(token: str, api_url: str, chat_id: str) -> tuple[int, int, i
     # ── chats/setTitle ─────────────────────────────────────────────
     section("chats/setTitle + setAbout + setRules")
     original_title = info.title if info else None
-    try:
-        r = await bot.set_chat_title(chat_id, "vkworkspace test title")
-        assert r.ok
-        ok("set_chat_title")
-        passed += 1
-        # restore
-        if original_title:
-            await bot.set_chat_title(chat_id, original_title)
-    except Exception as e:
-        fail("set_chat_title", e)
-        failed += 1
-
-    try:
-        r = await bot.set_chat_about(chat_id, "vkworkspace live test description")
-        assert r.ok
-        ok("set_chat_about")
-        passed += 1
-    except Exception as e:
-        fail("set_chat_about", e)
-        failed += 1
-
-    try:
-        r = await bot.set_chat_rules(chat_id, "vkworkspace live test rules")
-        assert r.ok
-        ok("set_chat_rules")
-        passed += 1
-    except Exception as e:
-        fail("set_chat_rules", e)
-        failed += 1
+    title_r, about_r, rules_r = await asyncio.gather(
+        bot.set_chat_title(chat_id, "vkworkspace test title"),
+        bot.set_chat_about(chat_id, "vkworkspace live test description"),
+        bot.set_chat_rules(chat_id, "vkworkspace live test rules"),
+        return_exceptions=True,
+    )
+    reports = [
+        _report("set_chat_title", title_r, _assert_ok),
+        _report("set_chat_about", about_r, _assert_ok),
+        _report("set_chat_rules", rules_r, _assert_ok),
+    ]
+    passed += sum(reports)
+    failed += len(reports) - sum(reports)
+    # restore
+    if reports[0] and original_title:
+        await bot.set_chat_title(chat_id, original_title)
 
     # ── chats/avatar/set ───────────────────────────────────────────
     section("chats/avatar/set")
     try:
-        # 800x800 valid PNG (red square)
-        # Generated minimal valid PNG with IDAT
-        import struct
-        import zlib
-
-        width, height = 800, 800
-        # raw image data: filter byte 0 + 3 bytes RGB per pixel, per row
-        raw_data = b""
-        for _ in range(height):
-            raw_data += b"\x00" + b"\xff\x00\x00" * width  # filter=0, red pixels
-        compressed = zlib.compress(raw_data)
-
-        def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
-            c = chunk_type + data
-            return struct.pack(">I", len(data)) + c + struct.pack(">I", zlib.crc32(c) & 0xFFFFFFFF)
-
-        png = b"\x89PNG\r\n\x1a\n"
-        png += _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
-        png += _png_chunk(b"IDAT", compressed)
-        png += _png_chunk(b"IEND", b"")
-
-        inp = InputFile(io.BytesIO(png), filename="avatar.png")
+        inp = InputFile(_AVATAR_PNG, filename="avatar.png")
         r = await bot.set_chat_avatar(chat_id, inp)
         assert r.ok
         ok("set_chat_avatar")
@@ -559,27 +471,26 @@ async def run_tests(token: str, api_url: str, chat_id: str) -> tuple[int, int, i
 
     # ── messages/deleteMessages (cleanup) ──────────────────────────
     section("messages/deleteMessages (cleanup)")
-    valid_msgs = [m for m in cleanup_msgs if m]
-    if valid_msgs:
-        deleted = 0
-        delete_errors: list[str] = []
-        for msg_id in valid_msgs:
-            try:
-                r = await bot.delete_messages(chat_id, msg_id)
-                if r.ok:
-                    deleted += 1
-            except Exception as e:
-                delete_errors.append(str(e))
-
-        if deleted == len(valid_msgs):
-            ok("delete_messages", f"deleted {deleted}/{len(valid_msgs)} test messages")
+    if cleanup_msgs:
+        sem = asyncio.Semaphore(_CLEANUP_CONCURRENCY)
+
+        async def delete(msg_id: str) -> Any:
+            async with sem:
+                return await bot.delete_messages(chat_id, msg_id)
+
+        results = await asyncio.gather(*map(delete, cleanup_msgs), return_exceptions=True)
+        deleted = sum(1 for r in results if not isinstance(r, BaseException) and r.ok)
+        delete_errors = [str(r) for r in results if isinstance(r, BaseException)]
+
+        if deleted == len(cleanup_msgs):
+            ok("delete_messages", f"deleted {deleted}/{len(cleanup_msgs)} test messages")
             passed += 1
         elif deleted > 0:
-            ok("delete_messages", f"deleted {deleted}/{len(valid_msgs)} (some failed)")
+            ok("delete_messages", f"deleted {deleted}/{len(cleanup_msgs)} (some failed)")
             passed += 1
         else:
             first_err = delete_errors[0] if delete_errors else "?"
-            fail("delete_messages", Exception(f"0/{len(valid_msgs)} deleted: {first_err}"))
+            fail("delete_messages", Exception(f"0/{len(cleanup_msgs)} deleted: {first_err}"))
             failed += 1
     else:
         skip("delete_messages", "no messages to clean up")
@@ -592,6 +503,21 @@ async def run_tests(token: str, api_url: str, chat_id: str) -> tuple[int, int, i
 # ── main ───────────────────────────────────────────────────────────────
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """uvloop/winloop's loop factory when ``VKWS_UVLOOP=1``, else the default."""
+    if os.getenv("VKWS_UVLOOP") != "1":
+        return None
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop  # type: ignore[import-not-found]
+        else:
+            import uvloop as fast_loop  # type: ignore[import-not-found]
+    except ImportError:
+        print(f"{YELLOW}WARNING:{RESET} VKWS_UVLOOP=1 but uvloop/winloop is not installed")
+        return None
+    return fast_loop.new_event_loop
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="vkworkspace live API test")
     parser.add_argument("--token", default=os.getenv("VKWS_TOKEN"), help="Bot token")
@@ -614,20 +540,23 @@ def main() -> None:
     print(f"  Chat:  {args.chat}")
     print(f"  Token: {args.token[:8]}...{args.token[-4:]}")
 
-    passed, failed, skipped = asyncio.run(run_tests(args.token, args.api_url, args.chat))
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        passed, failed, skipped = runner.run(run_tests(args.token, args.api_url, args.chat))
 
     total = passed + failed + skipped
-    print(f"\n{BOLD}{'═' * 50}{RESET}")
-    print(
+    verdict = (
+        f"  {GREEN}{BOLD}ALL TESTS PASSED{RESET}"
+        if failed == 0
+        else f"  {RED}{BOLD}{failed} TEST(S) FAILED{RESET}"
+    )
+    # one write, so the summary can't interleave with other output
+    sys.stdout.write(
+        f"\n{BOLD}{'═' * 50}{RESET}\n"
         f"  {GREEN}{passed} passed{RESET}  /  {RED}{failed} failed{RESET}"
-        f"  /  {YELLOW}{skipped} skipped{RESET}  /  {total} total"
+        f"  /  {YELLOW}{skipped} skipped{RESET}  /  {total} total\n"
+        f"\n{verdict}\n\n"
     )
 
-    if failed == 0:
-        print(f"\n  {GREEN}{BOLD}ALL TESTS PASSED{RESET}\n")
-    else:
-        print(f"\n  {RED}{BOLD}{failed} TEST(S) FAILED{RESET}\n")
-
     sys.exit(1 if failed > 0 else 0)
 
 
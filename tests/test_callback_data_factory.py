@@ -1,7 +1,5 @@
 """Tests for CallbackDataFactory — structured callback data."""
 
-from types import SimpleNamespace
-
 import pytest
 
 from vkworkspace.filters.callback_data import CallbackDataFactory
@@ -72,6 +70,12 @@ class TestPackUnpack:
     def test_custom_sep_pack(self):
         assert CustomSepCB(a="foo", b=3).pack() == "x|foo|3"
 
+    def test_pack_percent_is_literal(self):
+        class PercentCB(CallbackDataFactory, prefix="p%s"):
+            v: str
+
+        assert PercentCB(v="100%").pack() == "p%s:100%"
+
     def test_custom_sep_unpack(self):
         cb = CustomSepCB.unpack("x|bar|5")
         assert cb.a == "bar"
@@ -97,62 +101,63 @@ class TestPackUnpack:
 # ── filter ──────────────────────────────────────────────────────────
 
 
-def _make_event(callback_data: str | None = None) -> SimpleNamespace:
-    return SimpleNamespace(callback_data=callback_data)
+class _Event:
+    """Minimal stand-in for a callback query: only ``callback_data``."""
+
+    __slots__ = ("callback_data",)
+
+    def __init__(self, callback_data: str | None = None) -> None:
+        self.callback_data = callback_data
+
+
+class _EmptyEvent:
+    __slots__ = ()
 
 
 class TestFilter:
-    @pytest.mark.asyncio
     async def test_matches_prefix(self):
         f = ProductCB.filter()
-        result = await f(_make_event("product:buy:42"))
+        result = await f(_Event("product:buy:42"))
         assert isinstance(result, dict)
         assert result["callback_data"].action == "buy"
         assert result["callback_data"].id == 42
 
-    @pytest.mark.asyncio
     async def test_no_match_wrong_prefix(self):
         f = ProductCB.filter()
-        result = await f(_make_event("other:buy:42"))
+        result = await f(_Event("other:buy:42"))
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_no_match_none(self):
         f = ProductCB.filter()
-        result = await f(_make_event(None))
+        result = await f(_Event(None))
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_no_match_malformed(self):
         f = ProductCB.filter()
-        result = await f(_make_event("product:buy"))
+        result = await f(_Event("product:buy"))
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_filter_with_magic_rule(self):
         from vkworkspace import F
 
         f = ProductCB.filter(F.action == "buy")
         # Matches
-        result = await f(_make_event("product:buy:42"))
+        result = await f(_Event("product:buy:42"))
         assert isinstance(result, dict)
         assert result["callback_data"].id == 42
 
         # Doesn't match rule
-        result = await f(_make_event("product:info:42"))
+        result = await f(_Event("product:info:42"))
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_filter_no_callback_data_attr(self):
         f = ProductCB.filter()
-        event = SimpleNamespace()  # no callback_data attribute
-        result = await f(event)
+        result = await f(_EmptyEvent())  # no callback_data attribute
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_custom_sep_filter(self):
         f = CustomSepCB.filter()
-        result = await f(_make_event("x|hello|10"))
+        result = await f(_Event("x|hello|10"))
         assert isinstance(result, dict)
         assert result["callback_data"].a == "hello"
         assert result["callback_data"].b == 10
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Any
 
 import pytest
 
+from vkworkspace.dispatcher import Dispatcher, Router
+from vkworkspace.dispatcher.middlewares import fsm_context
 from vkworkspace.dispatcher.middlewares.fsm_context import FSMContextMiddleware
 from vkworkspace.fsm.state import State, StatesGroup
 from vkworkspace.fsm.storage.base import StorageKey
@@ -42,7 +45,34 @@ def _make_data() -> dict[str, Any]:
     return {"bot": _FakeBot()}
 
 
-@pytest.mark.asyncio
+async def _round_trip(ticks: int) -> None:
+    for _ in range(ticks):
+        await asyncio.sleep(0)
+
+
+class _YieldingStorage(MemoryStorage):
+    """MemoryStorage that yields to the loop on every call, like Redis.
+
+    Writes take a few loop ticks, reads one.
+    """
+
+    async def set_state(self, key: StorageKey, state: str | None) -> None:
+        await _round_trip(3)
+        await super().set_state(key, state)
+
+    async def get_state(self, key: StorageKey) -> str | None:
+        await _round_trip(1)
+        return await super().get_state(key)
+
+    async def set_data(self, key: StorageKey, data: dict[str, Any]) -> None:
+        await _round_trip(3)
+        await super().set_data(key, data)
+
+    async def get_data(self, key: StorageKey) -> dict[str, Any]:
+        await _round_trip(1)
+        return await super().get_data(key)
+
+
 async def test_no_timeout_by_default() -> None:
     """Without session_timeout the state persists indefinitely."""
     storage = MemoryStorage()
@@ -61,7 +91,6 @@ async def test_no_timeout_by_default() -> None:
     assert captured["current_state"] == Form.name.state
 
 
-@pytest.mark.asyncio
 async def test_timeout_clears_expired_session() -> None:
     """Expired FSM session is cleared before handler runs."""
     storage = MemoryStorage()
@@ -84,7 +113,7 @@ async def test_timeout_clears_expired_session() -> None:
     assert key in mw._timestamps
 
     # Simulate time passing beyond timeout
-    mw._timestamps[key] = time.monotonic() - 10.0  # 10 seconds ago
+    mw._timestamps[key] = time.monotonic_ns() - 10 * 10**9  # 10 seconds ago
 
     await mw(handler, event, _make_data())
     assert captured["current_state"] is None  # session expired
@@ -93,7 +122,6 @@ async def test_timeout_clears_expired_session() -> None:
     assert await storage.get_state(key=key) is None
 
 
-@pytest.mark.asyncio
 async def test_timeout_keeps_fresh_session() -> None:
     """Fresh FSM session is not cleared."""
     storage = MemoryStorage()
@@ -117,7 +145,6 @@ async def test_timeout_keeps_fresh_session() -> None:
     assert captured["current_state"] == Form.age.state
 
 
-@pytest.mark.asyncio
 async def test_timeout_cleans_up_on_clear() -> None:
     """When handler clears state, timestamp is removed."""
     storage = MemoryStorage()
@@ -141,7 +168,6 @@ async def test_timeout_cleans_up_on_clear() -> None:
     assert key not in mw._timestamps
 
 
-@pytest.mark.asyncio
 async def test_timeout_stamps_on_new_state() -> None:
     """When handler sets a new state, timestamp is recorded."""
     storage = MemoryStorage()
@@ -155,3 +181,142 @@ async def test_timeout_stamps_on_new_state() -> None:
 
     await mw(handler, event, _make_data())
     assert key in mw._timestamps
+
+
+async def test_timeout_sweeps_abandoned_sessions(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A session whose user never returns is cleared on someone else's event."""
+    now = [1000 * 10**9]
+    monkeypatch.setattr(fsm_context.time, "monotonic_ns", lambda: now[0])
+
+    storage = MemoryStorage()
+    mw = FSMContextMiddleware(storage=storage, session_timeout=60.0)
+    gone = _FakeEvent()
+    gone.from_user = _FakeUser("user-gone")
+    gone_key = StorageKey(bot_id="test-token-12345", chat_id="chat-1", user_id="user-gone")
+
+    async def handler_set(ev: Any, data: dict[str, Any]) -> None:
+        await data["state"].set_state(Form.name)
+
+    async def handler_noop(ev: Any, data: dict[str, Any]) -> None:
+        pass
+
+    await mw(handler_set, gone, _make_data())
+    assert gone_key in mw._timestamps
+
+    now[0] += 61 * 10**9
+    await mw(handler_noop, _FakeEvent(), _make_data())
+    await asyncio.gather(*mw._sweeps)  # storage clears run in the background
+
+    assert gone_key not in mw._timestamps
+    assert await storage.get_state(key=gone_key) is None
+    assert mw._expiry_heap == []
+
+
+async def test_timeout_heap_holds_one_entry_per_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Repeated events from one user don't pile up expiry entries."""
+    now = [1000 * 10**9]
+    monkeypatch.setattr(fsm_context.time, "monotonic_ns", lambda: now[0])
+
+    storage = MemoryStorage()
+    mw = FSMContextMiddleware(storage=storage, session_timeout=60.0)
+    event = _FakeEvent()
+
+    async def handler_set(ev: Any, data: dict[str, Any]) -> None:
+        await data["state"].set_state(Form.name)
+
+    for _ in range(100):
+        now[0] += 10**9
+        await mw(handler_set, event, _make_data())
+    assert len(mw._expiry_heap) == 1
+
+    # Still active: the old entry is pushed back with the newer stamp
+    now[0] += 30 * 10**9
+    await mw(handler_set, event, _make_data())
+    now[0] += 31 * 10**9
+    await mw(handler_set, _FakeEvent(), _make_data())
+    assert len(mw._expiry_heap) == 1
+    key = StorageKey(bot_id="test-token-12345", chat_id="chat-1", user_id="user-1")
+    assert await storage.get_state(key=key) == Form.name.state
+
+
+async def test_returning_user_waits_for_background_clear(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A user back mid-sweep sees the cleared session and keeps new data."""
+    now = [1000 * 10**9]
+    monkeypatch.setattr(fsm_context.time, "monotonic_ns", lambda: now[0])
+
+    storage = _YieldingStorage()
+    mw = FSMContextMiddleware(storage=storage, session_timeout=60.0)
+    back = _FakeEvent()
+    back.from_user = _FakeUser("user-back")
+    key = StorageKey(bot_id="test-token-12345", chat_id="chat-1", user_id="user-back")
+
+    async def handler_old(ev: Any, data: dict[str, Any]) -> None:
+        await data["state"].set_state(Form.name)
+        await data["state"].set_data({"step": "old"})
+
+    captured: dict[str, Any] = {}
+
+    async def handler_new(ev: Any, data: dict[str, Any]) -> None:
+        captured["current_state"] = data["current_state"]
+        await data["state"].set_state(Form.age)
+        await data["state"].set_data({"step": "new"})
+
+    async def handler_noop(ev: Any, data: dict[str, Any]) -> None:
+        pass
+
+    await mw(handler_old, back, _make_data())
+
+    now[0] += 61 * 10**9
+    await mw(handler_noop, _FakeEvent(), _make_data())  # starts the sweep
+    assert key in mw._expiring
+    await mw(handler_new, back, _make_data())
+    await mw.close()
+
+    assert captured["current_state"] is None
+    assert await storage.get_state(key=key) == Form.age.state
+    assert await storage.get_data(key=key) == {"step": "new"}
+    assert mw._expiring == {}
+
+
+async def test_dispatcher_shutdown_drains_background_clears(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Stopping the dispatcher waits for pending clears before shutdown hooks."""
+    now = [1000 * 10**9]
+    monkeypatch.setattr(fsm_context.time, "monotonic_ns", lambda: now[0])
+
+    storage = _YieldingStorage()
+    mw = FSMContextMiddleware(storage=storage, session_timeout=60.0)
+    router = Router()
+    router.message.outer_middleware(mw)
+    dp = Dispatcher(storage=storage)
+    dp.include_router(router)
+    gone_key = StorageKey(bot_id="test-token-12345", chat_id="chat-1", user_id="user-1")
+
+    pending_at_shutdown: list[int] = []
+
+    @dp.on_shutdown
+    async def record() -> None:
+        pending_at_shutdown.append(len(mw._sweeps))
+
+    async def handler_set(ev: Any, data: dict[str, Any]) -> None:
+        await data["state"].set_state(Form.name)
+
+    async def handler_noop(ev: Any, data: dict[str, Any]) -> None:
+        pass
+
+    await mw(handler_set, _FakeEvent(), _make_data())
+    now[0] += 61 * 10**9
+    other = _FakeEvent()
+    other.from_user = _FakeUser("user-2")
+    await mw(handler_noop, other, _make_data())
+    assert mw._sweeps
+
+    await dp.start_polling(handle_signals=False, close_bot_on_stop=False)
+
+    assert pending_at_shutdown == [0]
+    assert await storage.get_state(key=gone_key) is None
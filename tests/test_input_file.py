@@ -1,14 +1,13 @@
 """Tests for InputFile: disk, bytes, base64, URL."""
 
 import base64
-from io import BytesIO
+from io import BytesIO, FileIO
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
-from vkworkspace.types.input_file import InputFile, _filename_from_url
+from vkworkspace.types.input_file import InputFile, _download_client, _filename_from_url
 
 # ── Existing behaviour ───────────────────────────────────────────────
 
@@ -33,6 +32,7 @@ class TestInputFileBasic:
         f = InputFile(str(p))
         name, fp = f.read()
         assert name == "hello.txt"
+        assert isinstance(fp, FileIO)  # unbuffered
         assert fp.read() == b"hello"
         fp.close()
 
@@ -91,61 +91,59 @@ class TestFromBase64:
 
 
 class TestFromUrl:
-    @pytest.mark.asyncio
-    async def test_downloads_and_wraps(self):
-        fake_resp = httpx.Response(
-            200,
-            content=b"image bytes",
-            request=httpx.Request("GET", "https://example.com/photo.jpg"),
-        )
-
-        with patch("vkworkspace.types.input_file.httpx.AsyncClient") as mock_cls:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=fake_resp)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_cls.return_value = mock_client
-
-            f = await InputFile.from_url("https://example.com/photo.jpg")
+    async def test_downloads_and_wraps(self, fake_download):
+        fake_download(200, b"image bytes")
+        f = await InputFile.from_url("https://example.com/photo.jpg")
 
         name, fp = f.read()
         assert name == "photo.jpg"
         assert fp.read() == b"image bytes"
 
-    @pytest.mark.asyncio
-    async def test_custom_filename_overrides(self):
-        fake_resp = httpx.Response(
-            200, content=b"data", request=httpx.Request("GET", "https://example.com/photo.jpg")
-        )
-
-        with patch("vkworkspace.types.input_file.httpx.AsyncClient") as mock_cls:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=fake_resp)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_cls.return_value = mock_client
-
-            f = await InputFile.from_url(
-                "https://example.com/photo.jpg",
-                filename="custom.png",
-            )
+    async def test_custom_filename_overrides(self, fake_download):
+        fake_download(200, b"data")
+        f = await InputFile.from_url("https://example.com/photo.jpg", filename="custom.png")
 
         name, _ = f.read()
         assert name == "custom.png"
 
-    @pytest.mark.asyncio
-    async def test_http_error_propagates(self):
-        fake_resp = httpx.Response(404, request=httpx.Request("GET", "https://x.com/missing.jpg"))
+    async def test_http_error_propagates(self, fake_download):
+        fake_download(404)
+        with pytest.raises(httpx.HTTPStatusError):
+            await InputFile.from_url("https://x.com/missing.jpg")
+
+    async def test_large_download_spills_to_disk(self, fake_download):
+        body = b"x" * (3 * 1024 * 1024)
+        fake_download(200, body)
+        f = await InputFile.from_url("https://example.com/big.bin")
+
+        _, fp = f.read()
+        assert not isinstance(fp, BytesIO)
+        fp.fileno()  # a real file on disk
+        assert fp.read() == body
+        fp.close()
+
+    async def test_small_download_stays_in_memory(self, fake_download):
+        fake_download(200, b"x" * 1024)
+        f = await InputFile.from_url("https://example.com/small.png")
+
+        assert f.file == b"x" * 1024
+        _, fp = f.read()
+        assert isinstance(fp, BytesIO)
+
+    async def test_max_size_exceeded(self, fake_download):
+        fake_download(200, b"x" * 2048)
+        with pytest.raises(ValueError, match="too large"):
+            await InputFile.from_url("https://example.com/big.bin", max_size=1024)
 
-        with patch("vkworkspace.types.input_file.httpx.AsyncClient") as mock_cls:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=fake_resp)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_cls.return_value = mock_client
+    async def test_client_shared_per_proxy_until_closed(self):
+        first = _download_client(None)
+        assert _download_client(None) is first
+        assert _download_client("http://proxy:8080") is not first
 
-            with pytest.raises(httpx.HTTPStatusError):
-                await InputFile.from_url("https://x.com/missing.jpg")
+        await InputFile.close_download_clients()
+        assert first.is_closed
+        assert _download_client(None) is not first
+        await InputFile.close_download_clients()
 
 
 # ── _filename_from_url ───────────────────────────────────────────────
@@ -0,0 +1,37 @@
+"""Tests for MemoryStorage."""
+
+from __future__ import annotations
+
+from vkworkspace.fsm.storage.base import StorageKey
+from vkworkspace.fsm.storage.memory import MemoryStorage
+
+KEY = StorageKey(bot_id="bot", chat_id="chat-1", user_id="user-1")
+
+
+async def test_reads_do_not_create_records() -> None:
+    storage = MemoryStorage()
+    assert await storage.get_state(KEY) is None
+    assert await storage.get_data(KEY) == {}
+    assert KEY not in storage._storage
+
+
+async def test_state_and_data_roundtrip() -> None:
+    storage = MemoryStorage()
+    data = {"name": "Alice"}
+    await storage.set_state(KEY, "Form:name")
+    await storage.set_data(KEY, data)
+
+    data["name"] = "changed"  # stored as a copy
+    assert await storage.get_state(KEY) == "Form:name"
+    assert await storage.get_data(KEY) == {"name": "Alice"}
+
+
+async def test_cleared_record_is_dropped() -> None:
+    storage = MemoryStorage()
+    await storage.set_state(KEY, "Form:name")
+    await storage.set_data(KEY, {"name": "Alice"})
+
+    await storage.set_state(KEY, None)
+    assert KEY in storage._storage  # data still set
+    await storage.set_data(KEY, {})
+    assert KEY not in storage._storage
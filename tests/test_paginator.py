@@ -40,6 +40,12 @@ class TestPaginatorProperties:
         p = Paginator(data=data, per_page=5, current_page=2)
         assert list(p.page_data) == [10, 11]
 
+    def test_iter_page_matches_page_data(self):
+        data = list(range(12))
+        for page in range(4):
+            p = Paginator(data=data, per_page=5, current_page=page)
+            assert list(p.iter_page()) == list(p.page_data)
+
     def test_has_prev_first_page(self):
         p = Paginator(data=list(range(10)), per_page=5, current_page=0)
         assert p.has_prev is False
@@ -103,6 +109,12 @@ class TestNavButtons:
         counter_cb = PaginationCB.unpack(buttons[1].callback_data)
         assert counter_cb.page == 1  # same page (no-op)
 
+    def test_callback_strings_match_pack(self):
+        p = Paginator(data=list(range(15)), per_page=5, current_page=1, name="x")
+        assert [b.callback_data for b in p.nav_buttons()] == [
+            PaginationCB(name="x", page=page).pack() for page in (0, 1, 2)
+        ]
+
 
 class TestAddNavRow:
     def test_adds_row_to_builder(self):
@@ -161,3 +173,16 @@ class TestEdgeCases:
         p = Paginator(data=[1, 2, 3], per_page=2, current_page=99)
         assert list(p.page_data) == []
         assert p.has_next is False
+
+    def test_reassigned_inputs_update_derived_values(self):
+        p = Paginator(data=list(range(10)), per_page=5, current_page=0)
+        p.current_page += 1
+        assert p.offset == 5
+        assert p.has_prev is True
+        assert p.has_next is False
+        p.per_page = 2
+        assert p.total_pages == 5
+        assert p.has_next is True
+        p.data = list(range(3))
+        assert p.total_pages == 2
+        assert p.has_next is False
@@ -1,11 +1,15 @@
 """Tests for Scheduler — interval, daily, weekly jobs."""
 
 import asyncio
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
+from vkworkspace.client.bot import Bot
 from vkworkspace.utils.scheduler import (
     Scheduler,
     _seconds_until,
@@ -13,20 +17,24 @@ from vkworkspace.utils.scheduler import (
 )
 
 
+@contextmanager
+def _frozen_at(now: datetime) -> Iterator[None]:
+    """Make the scheduler's clock read *now* (local time)."""
+    with patch("vkworkspace.utils.scheduler.time", wraps=time) as clock:
+        clock.time.return_value = now.timestamp()
+        yield
+
+
 class TestSecondsUntil:
     def test_future_today(self):
         fake_now = datetime(2026, 1, 1, 8, 0, 0)
-        with patch("vkworkspace.utils.scheduler.datetime") as mock_dt:
-            mock_dt.now.return_value = fake_now
-            mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
+        with _frozen_at(fake_now):
             result = _seconds_until(9, 0)
         assert result == pytest.approx(3600.0)
 
     def test_past_today_goes_to_tomorrow(self):
         fake_now = datetime(2026, 1, 1, 10, 0, 0)
-        with patch("vkworkspace.utils.scheduler.datetime") as mock_dt:
-            mock_dt.now.return_value = fake_now
-            mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
+        with _frozen_at(fake_now):
             result = _seconds_until(9, 0)
         # 23 hours
         assert result == pytest.approx(23 * 3600.0)
@@ -37,18 +45,14 @@ class TestSecondsUntilWeekday:
         # Wednesday 2026-01-07 08:00, target Wednesday 09:00
         fake_now = datetime(2026, 1, 7, 8, 0, 0)
         assert fake_now.weekday() == 2  # Wednesday
-        with patch("vkworkspace.utils.scheduler.datetime") as mock_dt:
-            mock_dt.now.return_value = fake_now
-            mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
+        with _frozen_at(fake_now):
             result = _seconds_until_weekday(2, 9, 0)
         assert result == pytest.approx(3600.0)
 
     def test_past_same_day_goes_to_next_week(self):
         # Wednesday 2026-01-07 10:00, target Wednesday 09:00
         fake_now = datetime(2026, 1, 7, 10, 0, 0)
-        with patch("vkworkspace.utils.scheduler.datetime") as mock_dt:
-            mock_dt.now.return_value = fake_now
-            mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
+        with _frozen_at(fake_now):
             result = _seconds_until_weekday(2, 9, 0)
         # 6 days 23 hours
         assert result == pytest.approx(6 * 86400 + 23 * 3600)
@@ -57,16 +61,13 @@ class TestSecondsUntilWeekday:
         # Monday 2026-01-05 12:00, target Friday 18:00
         fake_now = datetime(2026, 1, 5, 12, 0, 0)
         assert fake_now.weekday() == 0  # Monday
-        with patch("vkworkspace.utils.scheduler.datetime") as mock_dt:
-            mock_dt.now.return_value = fake_now
-            mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
+        with _frozen_at(fake_now):
             result = _seconds_until_weekday(4, 18, 0)
         # 4 days 6 hours
         assert result == pytest.approx(4 * 86400 + 6 * 3600)
 
 
 class TestSchedulerLifecycle:
-    @pytest.mark.asyncio
     async def test_interval_job_runs(self):
         scheduler = Scheduler()
         calls: list[str] = []
@@ -75,14 +76,13 @@ class TestSchedulerLifecycle:
         async def tick(bot):
             calls.append("tick")
 
-        bot = AsyncMock()
+        bot = Mock(spec=Bot)
         scheduler.start(bot)
         await asyncio.sleep(0.2)
         await scheduler.stop()
 
         assert len(calls) >= 2
 
-    @pytest.mark.asyncio
     async def test_interval_run_at_start_false(self):
         scheduler = Scheduler()
         calls: list[str] = []
@@ -91,7 +91,7 @@ class TestSchedulerLifecycle:
         async def lazy(bot):
             calls.append("lazy")
 
-        bot = AsyncMock()
+        bot = Mock(spec=Bot)
         scheduler.start(bot)
         await asyncio.sleep(0.1)
         await scheduler.stop()
@@ -99,7 +99,6 @@ class TestSchedulerLifecycle:
         # Should not have run (interval=60s, run_at_start=False)
         assert len(calls) == 0
 
-    @pytest.mark.asyncio
     async def test_double_start_ignored(self):
         scheduler = Scheduler()
 
@@ -107,14 +106,13 @@ class TestSchedulerLifecycle:
         async def tick(bot):
             pass
 
-        bot = AsyncMock()
+        bot = Mock(spec=Bot)
         scheduler.start(bot)
         initial_tasks = len(scheduler._tasks)
         scheduler.start(bot)  # second start — should be ignored
         assert len(scheduler._tasks) == initial_tasks
         await scheduler.stop()
 
-    @pytest.mark.asyncio
     async def test_stop_cancels_tasks(self):
         scheduler = Scheduler()
 
@@ -122,14 +120,41 @@ class TestSchedulerLifecycle:
         async def tick(bot):
             pass
 
-        bot = AsyncMock()
+        bot = Mock(spec=Bot)
         scheduler.start(bot)
         assert scheduler.is_running is True
         await scheduler.stop()
         assert scheduler.is_running is False
         assert len(scheduler._tasks) == 0
 
-    @pytest.mark.asyncio
+    async def test_stop_waits_for_running_jobs_together(self):
+        scheduler = Scheduler()
+        started: list[str] = []
+        cancelled: list[str] = []
+
+        def make(name: str):
+            async def job(bot):
+                started.append(name)
+                try:
+                    await asyncio.sleep(3600)
+                except asyncio.CancelledError:
+                    cancelled.append(name)
+                    raise
+
+            return job
+
+        for name in ("a", "b", "c"):
+            scheduler.interval(seconds=60, name=name)(make(name))
+
+        scheduler.start(Mock(spec=Bot))
+        while len(started) < 3:
+            await asyncio.sleep(0)
+        await asyncio.wait_for(scheduler.stop(), timeout=1)
+
+        assert sorted(cancelled) == ["a", "b", "c"]
+        assert len(scheduler._tasks) == 0
+        await scheduler.stop()  # already stopped: no-op
+
     async def test_job_exception_does_not_crash_scheduler(self):
         scheduler = Scheduler()
         calls = []
@@ -139,7 +164,7 @@ class TestSchedulerLifecycle:
             calls.append("boom")
             raise RuntimeError("test error")
 
-        bot = AsyncMock()
+        bot = Mock(spec=Bot)
         scheduler.start(bot)
         await asyncio.sleep(0.2)
         await scheduler.stop()
@@ -147,7 +172,40 @@ class TestSchedulerLifecycle:
         # Should have retried despite exceptions
         assert len(calls) >= 2
 
-    @pytest.mark.asyncio
+    async def test_slow_job_does_not_delay_others(self):
+        scheduler = Scheduler()
+        calls: list[str] = []
+        release = asyncio.Event()
+
+        @scheduler.interval(seconds=0.05, name="slow")
+        async def slow(bot):
+            calls.append("slow")
+            await release.wait()
+
+        @scheduler.interval(seconds=0.05, name="fast")
+        async def fast(bot):
+            calls.append("fast")
+
+        scheduler.start(Mock(spec=Bot))
+        await asyncio.sleep(0.2)
+        await scheduler.stop()
+
+        # fast kept firing; slow never overlapped with its own pending run
+        assert calls.count("slow") == 1
+        assert calls.count("fast") >= 2
+
+    def test_daily_does_not_refire_same_minute(self):
+        scheduler = Scheduler()
+
+        @scheduler.daily(hour=9, minute=0)
+        async def report(bot):
+            pass
+
+        job = scheduler._jobs[0]
+        # Woke a moment early: the run finished at 08:59:59.5
+        with _frozen_at(datetime(2026, 1, 1, 8, 59, 59, 500000)):
+            assert job.next_delay() == pytest.approx(86400.5)
+
     async def test_jobs_property(self):
         scheduler = Scheduler()
 
@@ -163,7 +221,6 @@ class TestSchedulerLifecycle:
 
 
 class TestSchedulerDI:
-    @pytest.mark.asyncio
     async def test_extra_kwargs_injected(self):
         scheduler = Scheduler()
         received: list[dict] = []
@@ -172,7 +229,7 @@ class TestSchedulerDI:
         async def job(bot, db):
             received.append({"bot": bot, "db": db})
 
-        bot = AsyncMock()
+        bot = Mock(spec=Bot)
         fake_db = object()
         scheduler.start(bot, db=fake_db, config="not_needed")
         await asyncio.sleep(0.1)
@@ -182,7 +239,6 @@ class TestSchedulerDI:
         assert received[0]["bot"] is bot
         assert received[0]["db"] is fake_db
 
-    @pytest.mark.asyncio
     async def test_var_kwargs_receives_all(self):
         scheduler = Scheduler()
         received: list[dict] = []
@@ -191,7 +247,7 @@ class TestSchedulerDI:
         async def job(bot, **kwargs):
             received.append(kwargs)
 
-        bot = AsyncMock()
+        bot = Mock(spec=Bot)
         scheduler.start(bot, db="db_val", config="cfg_val")
         await asyncio.sleep(0.1)
         await scheduler.stop()
@@ -199,7 +255,6 @@ class TestSchedulerDI:
         assert len(received) >= 1
         assert received[0] == {"db": "db_val", "config": "cfg_val"}
 
-    @pytest.mark.asyncio
     async def test_no_extra_kwargs_filtered(self):
         scheduler = Scheduler()
         received: list[str] = []
@@ -208,7 +263,7 @@ class TestSchedulerDI:
         async def job(bot):
             received.append("ok")
 
-        bot = AsyncMock()
+        bot = Mock(spec=Bot)
         # Extra kwargs should be silently filtered out
         scheduler.start(bot, db="unused", config="unused")
         await asyncio.sleep(0.1)
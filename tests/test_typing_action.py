@@ -16,8 +16,24 @@ def _make_event(chat_id: str = "chat-1") -> SimpleNamespace:
     return SimpleNamespace(chat=chat, bot=bot)
 
 
+def _signalling_bot() -> tuple[SimpleNamespace, asyncio.Event]:
+    """Bot whose ``send_actions`` sets the returned event on every call."""
+    sent = asyncio.Event()
+    bot = SimpleNamespace(send_actions=AsyncMock(side_effect=lambda *a, **kw: sent.set()))
+    return bot, sent
+
+
+async def _assert_no_more_sends(bot: SimpleNamespace) -> None:
+    # With interval=0 a timer left running would fire on every loop
+    # iteration, so a few yields are enough to catch it
+    await asyncio.sleep(0)
+    count = bot.send_actions.call_count
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert bot.send_actions.call_count == count
+
+
 class TestTypingAction:
-    @pytest.mark.asyncio
     async def test_sends_typing_during_handler(self):
         event = _make_event()
 
@@ -30,7 +46,6 @@ class TestTypingAction:
         assert result == "done"
         event.bot.send_actions.assert_called_with("chat-1", "typing")
 
-    @pytest.mark.asyncio
     async def test_custom_action(self):
         event = _make_event()
 
@@ -42,42 +57,34 @@ class TestTypingAction:
         await handler(event)
         event.bot.send_actions.assert_called_with("chat-1", "looking")
 
-    @pytest.mark.asyncio
     async def test_stops_after_handler_completes(self):
-        event = _make_event()
+        bot, sent = _signalling_bot()
+        event = SimpleNamespace(chat=SimpleNamespace(chat_id="chat-1"), bot=bot)
 
-        @typing_action(interval=0.01)
+        @typing_action(interval=0)
         async def handler(ev: SimpleNamespace) -> str:
-            await asyncio.sleep(0.05)
+            await sent.wait()
             return "ok"
 
         await handler(event)
-        # Give time for cancelled task to settle
-        await asyncio.sleep(0.02)
-        call_count = event.bot.send_actions.call_count
         # Should not keep growing after handler returns
-        await asyncio.sleep(0.05)
-        assert event.bot.send_actions.call_count == call_count
+        await _assert_no_more_sends(bot)
 
-    @pytest.mark.asyncio
     async def test_stops_on_exception(self):
-        event = _make_event()
+        bot, sent = _signalling_bot()
+        event = SimpleNamespace(chat=SimpleNamespace(chat_id="chat-1"), bot=bot)
 
-        @typing_action(interval=0.01)
+        @typing_action(interval=0)
         async def handler(ev: SimpleNamespace) -> None:
-            await asyncio.sleep(0.03)
+            await sent.wait()
             raise ValueError("boom")
 
         with pytest.raises(ValueError, match="boom"):
             await handler(event)
 
-        # Task should be cancelled even on error
-        await asyncio.sleep(0.05)
-        final_count = event.bot.send_actions.call_count
-        await asyncio.sleep(0.05)
-        assert event.bot.send_actions.call_count == final_count
+        # Sending should stop even on error
+        await _assert_no_more_sends(bot)
 
-    @pytest.mark.asyncio
     async def test_no_chat_skips_action(self):
         event = SimpleNamespace(bot=SimpleNamespace(send_actions=AsyncMock()))
 
@@ -89,7 +96,6 @@ class TestTypingAction:
         assert result == "no chat"
         event.bot.send_actions.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_no_bot_skips_action(self):
         event = SimpleNamespace(chat=SimpleNamespace(chat_id="c1"))
 
@@ -100,7 +106,6 @@ class TestTypingAction:
         result = await handler(event)
         assert result == "no bot"
 
-    @pytest.mark.asyncio
     async def test_passes_kwargs(self):
         event = _make_event()
 
@@ -113,14 +118,12 @@ class TestTypingAction:
 
 
 class TestChatActionSender:
-    @pytest.mark.asyncio
     async def test_sends_typing_in_context(self):
         bot = SimpleNamespace(send_actions=AsyncMock())
         async with ChatActionSender(bot=bot, chat_id="c1"):  # type: ignore[arg-type]
             await asyncio.sleep(0.05)
         bot.send_actions.assert_called_with("c1", "typing")
 
-    @pytest.mark.asyncio
     async def test_custom_action(self):
         bot = SimpleNamespace(send_actions=AsyncMock())
         async with ChatActionSender(
@@ -131,43 +134,46 @@ class TestChatActionSender:
             await asyncio.sleep(0.05)
         bot.send_actions.assert_called_with("c1", "looking")
 
-    @pytest.mark.asyncio
     async def test_stops_after_exit(self):
-        bot = SimpleNamespace(send_actions=AsyncMock())
-        async with ChatActionSender(bot=bot, chat_id="c1", interval=0.01):  # type: ignore[arg-type]
-            await asyncio.sleep(0.05)
-        await asyncio.sleep(0.02)
-        count = bot.send_actions.call_count
-        await asyncio.sleep(0.05)
-        assert bot.send_actions.call_count == count
+        bot, sent = _signalling_bot()
+        async with ChatActionSender(bot=bot, chat_id="c1", interval=0):  # type: ignore[arg-type]
+            await sent.wait()
+        await _assert_no_more_sends(bot)
 
-    @pytest.mark.asyncio
     async def test_stops_on_exception(self):
-        bot = SimpleNamespace(send_actions=AsyncMock())
+        bot, sent = _signalling_bot()
         with pytest.raises(ValueError, match="boom"):
-            async with ChatActionSender(bot=bot, chat_id="c1", interval=0.01):  # type: ignore[arg-type]
-                await asyncio.sleep(0.03)
+            async with ChatActionSender(bot=bot, chat_id="c1", interval=0):  # type: ignore[arg-type]
+                await sent.wait()
                 raise ValueError("boom")
-        await asyncio.sleep(0.05)
-        count = bot.send_actions.call_count
-        await asyncio.sleep(0.05)
-        assert bot.send_actions.call_count == count
+        await _assert_no_more_sends(bot)
+
+    async def test_resends_every_interval(self):
+        bot, sent = _signalling_bot()
+        async with ChatActionSender(bot=bot, chat_id="c1", interval=0):  # type: ignore[arg-type]
+            for _ in range(3):
+                sent.clear()
+                await sent.wait()
+        assert bot.send_actions.call_count >= 3
+
+    async def test_failed_send_does_not_break_block(self, caplog: pytest.LogCaptureFixture):
+        bot = SimpleNamespace(send_actions=AsyncMock(side_effect=RuntimeError("api down")))
+        async with ChatActionSender(bot=bot, chat_id="c1", interval=0.01):  # type: ignore[arg-type]
+            await asyncio.sleep(0.03)
+        assert "Failed to send chat action" in caplog.text
 
-    @pytest.mark.asyncio
     async def test_typing_classmethod(self):
         bot = SimpleNamespace(send_actions=AsyncMock())
         async with ChatActionSender.typing(bot=bot, chat_id="c1"):  # type: ignore[arg-type]
             await asyncio.sleep(0.05)
         bot.send_actions.assert_called_with("c1", "typing")
 
-    @pytest.mark.asyncio
     async def test_looking_classmethod(self):
         bot = SimpleNamespace(send_actions=AsyncMock())
         async with ChatActionSender.looking(bot=bot, chat_id="c1"):  # type: ignore[arg-type]
             await asyncio.sleep(0.05)
         bot.send_actions.assert_called_with("c1", "looking")
 
-    @pytest.mark.asyncio
     async def test_reentrant(self):
         """Can be used multiple times."""
         bot = SimpleNamespace(send_actions=AsyncMock())
@@ -181,7 +187,6 @@ class TestChatActionSender:
 
 
 class TestMessageTyping:
-    @pytest.mark.asyncio
     async def test_message_typing(self):
         from vkworkspace.types.message import Message
 
@@ -193,7 +198,6 @@ class TestMessageTyping:
             await asyncio.sleep(0.05)
         bot.send_actions.assert_called_with("chat-1", "typing")
 
-    @pytest.mark.asyncio
     async def test_message_typing_looking(self):
         from vkworkspace.types.message import Message
 
@@ -205,7 +209,6 @@ class TestMessageTyping:
             await asyncio.sleep(0.05)
         bot.send_actions.assert_called_with("c1", "looking")
 
-    @pytest.mark.asyncio
     async def test_answer_chat_action_default(self):
         from vkworkspace.types.message import Message
 
@@ -216,7 +219,6 @@ class TestMessageTyping:
         await msg.answer_chat_action()
         bot.send_actions.assert_called_once_with("chat-1", "typing")
 
-    @pytest.mark.asyncio
     async def test_answer_chat_action_looking(self):
         from vkworkspace.types.message import Message
 
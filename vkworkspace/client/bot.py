@@ -108,6 +108,7 @@ class Bot:
         parse_mode: ParseMode | str | None = None,
         retry_on_5xx: int | None = 3,
         verify_ssl: bool = True,
+        http2: bool = False,
     ) -> None:
         """
         Args:
@@ -125,6 +126,8 @@ class Bot:
                 with exponential backoff. ``None`` or ``0`` = no retries.
             verify_ssl: Verify server TLS certificate. Set ``False`` for
                 self-signed certs on on-premise servers.
+            http2: Talk HTTP/2 to the API so concurrent requests share one
+                connection. Needs ``pip install vkworkspace[http2]``.
         """
         self.token = token
         self.api_url = api_url.rstrip("/")
@@ -135,6 +138,7 @@ class Bot:
         self.parse_mode = parse_mode
         self.retry_on_5xx = retry_on_5xx
         self.verify_ssl = verify_ssl
+        self.http2 = http2
         self._rate_limiter: RateLimiter | None = RateLimiter(rate_limit) if rate_limit else None
         self._session: httpx.AsyncClient | None = None
         self._last_event_id: int = 0
@@ -149,6 +153,7 @@ class Bot:
                 follow_redirects=True,
                 proxy=self.proxy,
                 verify=self.verify_ssl,
+                http2=self.http2,
             )
         return self._session
 
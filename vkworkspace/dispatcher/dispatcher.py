@@ -15,8 +15,10 @@ from ..types.chat_member_event import (
     NewChatMembersEvent,
 )
 from ..types.event import Update
+from ..types.input_file import InputFile
 from ..types.message import Message
 from .event.bases import UNHANDLED
+from .middlewares.fsm_context import FSMContextMiddleware
 from .router import Router
 
 logger = logging.getLogger(__name__)
@@ -308,10 +310,27 @@ class Dispatcher(Router):
             logger.info("Polling cancelled")
         finally:
             self._running = False
+            await self._close_fsm_middlewares()
             await self.emit_shutdown()
             if close_bot_on_stop:
                 for bot in bots:
                     await bot.close()
+                await InputFile.close_download_clients()
+
+    async def _close_fsm_middlewares(self) -> None:
+        """Wait for FSM middlewares' background session clears.
+
+        Runs before the shutdown hooks, which usually close the storage.
+        """
+        routers: list[Router] = [self]
+        while routers:
+            router = routers.pop()
+            routers.extend(router._sub_routers)
+            for observer in router.observers.values():
+                for manager in (observer.outer_middleware, observer.middleware):
+                    for middleware in manager.middlewares:
+                        if isinstance(middleware, FSMContextMiddleware):
+                            await middleware.close()
 
     def _stop_signal(self) -> None:
         logger.info("Received stop signal")
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
+import itertools
+import logging
+import sys
 import time
 from collections.abc import Awaitable, Callable
+from functools import lru_cache
 from typing import Any
 
 from ...fsm.context import FSMContext
@@ -9,6 +15,14 @@ from ...fsm.storage.base import BaseStorage, StorageKey
 from ...fsm.strategy import FSMStrategy
 from .base import BaseMiddleware
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=64)
+def _bot_id(token: str) -> str:
+    """Storage-key bot id for *token*: sliced and interned once per token."""
+    return sys.intern(token[:16])
+
 
 class FSMContextMiddleware(BaseMiddleware):
     def __init__(
@@ -20,7 +34,19 @@ class FSMContextMiddleware(BaseMiddleware):
         self.storage = storage
         self.strategy = strategy
         self.session_timeout = session_timeout
-        self._timestamps: dict[StorageKey, float] = {}
+        # Stamps are integer time.monotonic_ns() values
+        self._timeout_ns = None if session_timeout is None else int(session_timeout * 1e9)
+        self._timestamps: dict[StorageKey, int] = {}
+        # (checked_at, seq, key), oldest first, at most one entry per key:
+        # a key restamped since checked_at is pushed back when popped, so
+        # the heap grows with sessions, not with events
+        self._expiry_heap: list[tuple[int, int, StorageKey]] = []
+        self._queued: set[StorageKey] = set()
+        self._seq = itertools.count()
+        # Expired keys whose storage is being cleared in the background;
+        # each event is set once that key's clear has finished
+        self._expiring: dict[StorageKey, asyncio.Event] = {}
+        self._sweeps: set[asyncio.Task[None]] = set()
 
     def _build_key(self, event: Any, data: dict[str, Any]) -> StorageKey | None:
         bot = data.get("bot")
@@ -33,7 +59,7 @@ class FSMContextMiddleware(BaseMiddleware):
         if not chat_id and not user_id:
             return None
 
-        bot_id = bot.token[:16] if bot else "unknown"
+        bot_id = _bot_id(bot.token) if bot else "unknown"
 
         if self.strategy == FSMStrategy.USER_IN_CHAT:
             return StorageKey(bot_id=bot_id, chat_id=chat_id or "", user_id=user_id or "")
@@ -44,23 +70,86 @@ class FSMContextMiddleware(BaseMiddleware):
 
         return None
 
+    def _stamp(self, key: StorageKey) -> None:
+        now = time.monotonic_ns()
+        self._timestamps[key] = now
+        if key not in self._queued:
+            self._queued.add(key)
+            heapq.heappush(self._expiry_heap, (now, next(self._seq), key))
+
+    def _sweep_expired(self, timeout_ns: int) -> None:
+        """Clear sessions that timed out without their user coming back.
+
+        Without this, keys of users who never write again would stay in
+        ``_timestamps`` (and their state in storage) forever.  Only the
+        bookkeeping happens here; the storage clears run in a background
+        task so the current event doesn't wait on other users' keys.
+        """
+        heap = self._expiry_heap
+        deadline = time.monotonic_ns() - timeout_ns
+        expired: list[StorageKey] = []
+        while heap and heap[0][0] < deadline:
+            _, _, key = heapq.heappop(heap)
+            stamped_at = self._timestamps.get(key)
+            if stamped_at is None:
+                self._queued.discard(key)
+            elif stamped_at >= deadline:
+                heapq.heappush(heap, (stamped_at, next(self._seq), key))
+            else:
+                self._queued.discard(key)
+                del self._timestamps[key]
+                if key not in self._expiring:
+                    self._expiring[key] = asyncio.Event()
+                    expired.append(key)
+        if expired:
+            task = asyncio.create_task(self._clear_expired(expired))
+            self._sweeps.add(task)
+            task.add_done_callback(self._sweeps.discard)
+
+    async def _clear_expired(self, keys: list[StorageKey]) -> None:
+        for key in keys:
+            try:
+                await FSMContext(storage=self.storage, key=key).clear()
+            except Exception:
+                logger.exception("Failed to clear expired FSM session %s", key)
+            finally:
+                # The key stays marked until here, so a returning user
+                # waits for the clear instead of racing it
+                self._expiring.pop(key).set()
+
+    async def close(self) -> None:
+        """Wait for background session clears to finish.
+
+        Called by the dispatcher on shutdown, before the storage is closed.
+        """
+        while self._sweeps:
+            await asyncio.gather(*self._sweeps)
+
     async def __call__(
         self,
         handler: Callable[[Any, dict[str, Any]], Awaitable[Any]],
         event: Any,
         data: dict[str, Any],
     ) -> Any:
+        timeout_ns = self._timeout_ns
+        if timeout_ns is not None and self._expiry_heap:
+            self._sweep_expired(timeout_ns)
+
         key = self._build_key(event, data)
 
         if key is not None:
             fsm_context = FSMContext(storage=self.storage, key=key)
+            clearing = self._expiring.get(key)
+            if clearing is not None:
+                # Swept a moment ago: let its clear finish before reading
+                await clearing.wait()
             current_state = await fsm_context.get_state()
 
             if (
                 current_state is not None
-                and self.session_timeout is not None
+                and timeout_ns is not None
                 and key in self._timestamps
-                and time.monotonic() - self._timestamps[key] > self.session_timeout
+                and time.monotonic_ns() - self._timestamps[key] > timeout_ns
             ):
                 await fsm_context.clear()
                 del self._timestamps[key]
@@ -74,10 +163,10 @@ class FSMContextMiddleware(BaseMiddleware):
 
         result = await handler(event, data)
 
-        if key is not None and self.session_timeout is not None:
+        if key is not None and timeout_ns is not None:
             new_state = await self.storage.get_state(key=key)
             if new_state is not None:
-                self._timestamps[key] = time.monotonic()
+                self._stamp(key)
             elif key in self._timestamps:
                 del self._timestamps[key]
 
@@ -64,6 +64,10 @@ class CallbackDataFactory(BaseModel):
 
     __callback_prefix__: ClassVar[str]
     __callback_sep__: ClassVar[str] = ":"
+    __callback_head__: ClassVar[str]  # prefix + sep
+    # Built once per subclass, after pydantic has collected the fields
+    __callback_fields__: ClassVar[tuple[str, ...]] = ()
+    __callback_template__: ClassVar[str]
 
     def __init_subclass__(
         cls,
@@ -79,6 +83,18 @@ class CallbackDataFactory(BaseModel):
             )
         cls.__callback_prefix__ = prefix
         cls.__callback_sep__ = sep
+        cls.__callback_head__ = prefix + sep
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # model_fields is only complete here, not in __init_subclass__.
+        # pack() becomes a single ``%`` format: "product:%s:%s"
+        fields = tuple(cls.model_fields)
+        sep = cls.__callback_sep__.replace("%", "%%")
+        prefix = cls.__callback_prefix__.replace("%", "%%")
+        cls.__callback_fields__ = fields
+        cls.__callback_template__ = sep.join([prefix, *(["%s"] * len(fields))])
 
     def pack(self) -> str:
         """Serialize to a callback_data string.
@@ -92,10 +108,9 @@ class CallbackDataFactory(BaseModel):
             cb = ProductCB(action="buy", id=42)
             cb.pack()  # "product:buy:42"
         """
-        sep = self.__callback_sep__
-        parts = [self.__callback_prefix__]
-        parts.extend(str(getattr(self, name)) for name in type(self).model_fields)
-        return sep.join(parts)
+        return self.__callback_template__ % tuple(
+            getattr(self, name) for name in self.__callback_fields__
+        )
 
     @classmethod
     def unpack(cls, data: str) -> Self:
@@ -114,20 +129,26 @@ class CallbackDataFactory(BaseModel):
             cb.id      # 42
         """
         sep = cls.__callback_sep__
-        prefix = cls.__callback_prefix__
-        parts = data.split(sep)
-
-        if parts[0] != prefix:
-            raise ValueError(f"Invalid prefix: expected {prefix!r}, got {parts[0]!r}")
-
-        field_names = list(cls.model_fields.keys())
-        values = parts[1:]
-
-        if len(values) != len(field_names):
+        head = cls.__callback_head__
+        field_names = cls.__callback_fields__
+        count = len(field_names)
+
+        if data.startswith(head):
+            # maxsplit: at most one piece past the expected count, however
+            # long a malformed input is
+            values = data[len(head) :].split(sep, count)
+        elif data == cls.__callback_prefix__:
+            values = []
+        else:
             raise ValueError(
-                f"{cls.__name__}: expected {len(field_names)} values, got {len(values)}"
+                f"Invalid prefix: expected {cls.__callback_prefix__!r}, "
+                f"got {data.partition(sep)[0]!r}"
             )
 
+        if len(values) != count:
+            got = len(values) if len(values) < count else count + 1 + values[-1].count(sep)
+            raise ValueError(f"{cls.__name__}: expected {count} values, got {got}")
+
         return cls(**dict(zip(field_names, values, strict=True)))
 
     @classmethod
@@ -166,6 +187,11 @@ class _CallbackDataFilter(BaseFilter):
     ) -> None:
         self._factory = factory
         self._rule = rule
+        # Resolved once here rather than on every callback event
+        self._head = factory.__callback_head__
+        self._prefix = factory.__callback_prefix__
+        self._unpack = factory.unpack
+        self._resolve = getattr(rule, "resolve", None) if rule is not None else None
 
     async def __call__(self, event: Any, **kwargs: Any) -> bool | dict[str, Any]:
         raw = getattr(event, "callback_data", None)
@@ -173,20 +199,18 @@ class _CallbackDataFilter(BaseFilter):
             return False
 
         # Quick prefix check before parsing
-        prefix = self._factory.__callback_prefix__
-        sep = self._factory.__callback_sep__
-        if not raw.startswith(prefix + sep) and raw != prefix:
+        if not raw.startswith(self._head) and raw != self._prefix:
             return False
 
         try:
-            parsed = self._factory.unpack(raw)
+            parsed = self._unpack(raw)
         except (ValueError, ValidationError):
             return False
 
         # Apply magic-filter rule if provided
-        if self._rule is not None and hasattr(self._rule, "resolve"):
+        if self._resolve is not None:
             try:
-                if not self._rule.resolve(parsed):
+                if not self._resolve(parsed):
                     return False
             except (AttributeError, KeyError, TypeError, ValueError):
                 return False
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Iterator
 from typing import Any
 
@@ -15,25 +16,32 @@ class State:
             age = State()     # state string will be "Form:age"
     """
 
+    __slots__ = ("_group", "_state", "_state_name")
+
     def __init__(self, state: str | None = None) -> None:
         self._state_name: str | None = state
         self._group: type | None = None
+        self._bind()
+
+    def _bind(self) -> None:
+        # Built once (and again when a StatesGroup claims the state) instead
+        # of on every access: handlers compare states on each update
+        group_name = self._group.__name__ if self._group else ""
+        self._state = sys.intern(f"{group_name}:{self._state_name or ''}")
 
     @property
     def state(self) -> str:
-        group_name = self._group.__name__ if self._group else ""
-        state_name = self._state_name or ""
-        return f"{group_name}:{state_name}"
+        return self._state
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, State):
-            return self.state == other.state
+            return self._state == other._state
         if isinstance(other, str):
-            return self.state == other
+            return self._state == other
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self.state)
+        return hash(self._state)
 
     def __repr__(self) -> str:
         return f"<State '{self.state}'>"
@@ -54,6 +62,7 @@ class StatesGroupMeta(type):
             if isinstance(attr_value, State):
                 attr_value._group = cls
                 attr_value._state_name = attr_name
+                attr_value._bind()
                 states.append(attr_value)
 
         cls.__all_states__ = tuple(states)  # type: ignore[attr-defined]
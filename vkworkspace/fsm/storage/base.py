@@ -7,7 +7,7 @@ from typing import Any
 DEFAULT_DESTINY = "default"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StorageKey:
     bot_id: str
     chat_id: str
@@ -7,7 +7,7 @@ from typing import Any
 from .base import BaseStorage, StorageKey
 
 
-@dataclass
+@dataclass(slots=True)
 class _StorageRecord:
     state: str | None = None
     data: dict[str, Any] = field(default_factory=dict)
@@ -17,22 +17,36 @@ class MemoryStorage(BaseStorage):
     """
     In-memory FSM storage. Data is lost on restart.
     Suitable for development and testing.
+
+    State and data of a key live in one record, so every call is a single
+    dict lookup. Reads never create records, and a record is dropped once
+    both its state and data are empty again.
     """
 
     def __init__(self) -> None:
         self._storage: dict[StorageKey, _StorageRecord] = defaultdict(_StorageRecord)
 
+    def _drop_if_empty(self, key: StorageKey, record: _StorageRecord) -> None:
+        if record.state is None and not record.data:
+            del self._storage[key]
+
     async def set_state(self, key: StorageKey, state: str | None) -> None:
-        self._storage[key].state = state
+        record = self._storage[key]
+        record.state = state
+        self._drop_if_empty(key, record)
 
     async def get_state(self, key: StorageKey) -> str | None:
-        return self._storage[key].state
+        record = self._storage.get(key)
+        return record.state if record else None
 
     async def set_data(self, key: StorageKey, data: dict[str, Any]) -> None:
-        self._storage[key].data = data.copy()
+        record = self._storage[key]
+        record.data = data.copy()
+        self._drop_if_empty(key, record)
 
     async def get_data(self, key: StorageKey) -> dict[str, Any]:
-        return self._storage[key].data.copy()
+        record = self._storage.get(key)
+        return record.data.copy() if record else {}
 
     async def close(self) -> None:
         self._storage.clear()
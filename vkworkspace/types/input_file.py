@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-import base64
+import asyncio
+import binascii
+import os
+import stat
+import weakref
 from io import BytesIO
 from pathlib import Path
+from tempfile import TemporaryFile
 from typing import BinaryIO
-from urllib.parse import unquote, urlparse
+from urllib.parse import unquote
 
 import httpx
 
@@ -38,6 +43,10 @@ class InputFile:
     ) -> None:
         """Create an InputFile.
 
+        Paths and streams are not read into memory: the upload reads them
+        in chunks as the request body is sent, so large files should be
+        passed by path rather than as ``bytes``.
+
         Args:
             file: File source — path (``str`` / ``Path``), raw ``bytes``,
                 or an open binary stream (``BinaryIO``).
@@ -64,10 +73,19 @@ class InputFile:
             FileNotFoundError: If *file* is a path and it doesn't exist.
         """
         if isinstance(self.file, (str, Path)):
-            path = Path(self.file).resolve()
-            if not path.is_file():
-                raise FileNotFoundError(f"File not found: {path}")
-            return self.filename or path.name, open(path, "rb")
+            # os-level calls instead of Path(...).resolve() + is_file(): no
+            # Path objects on the way, and no symlink resolution when the
+            # caller already chose the filename
+            try:
+                is_file = stat.S_ISREG(os.stat(self.file).st_mode)
+            except OSError:
+                is_file = False
+            if not is_file:
+                raise FileNotFoundError(f"File not found: {Path(self.file).resolve()}")
+            filename = self.filename or os.path.basename(os.path.realpath(self.file))
+            # Unbuffered: httpx reads uploads in 64 KiB chunks, larger than
+            # the default 8 KiB buffer, so the buffer would only add a copy
+            return filename, open(self.file, "rb", buffering=0)
         if isinstance(self.file, bytes):
             return self.filename, BytesIO(self.file)
         return self.filename, self.file
@@ -91,7 +109,8 @@ class InputFile:
             file = InputFile.from_base64(b64, filename="avatar.png")
             await bot.send_file(chat_id, file=file)
         """
-        return cls(file=base64.b64decode(data), filename=filename)
+        # What base64.b64decode(data) calls underneath, minus its wrappers
+        return cls(file=binascii.a2b_base64(data), filename=filename)
 
     _DEFAULT_MAX_SIZE: int = 50 * 1024 * 1024  # 50 MB
 
@@ -106,8 +125,14 @@ class InputFile:
     ) -> InputFile:
         """Download a file from *url* and wrap it as an InputFile.
 
-        The file is downloaded into memory and then sent as a normal upload.
-        For images (JPG/PNG/WEBP/GIF) VK Teams will display them inline.
+        The body is streamed: up to 1 MB is kept in memory, larger
+        downloads spill to a temporary file. It is then sent as a normal
+        upload. For images (JPG/PNG/WEBP/GIF) VK Teams will display
+        them inline.
+
+        Downloads reuse one pooled client per proxy (and event loop), so
+        repeated fetches from the same host skip the TCP/TLS handshake;
+        see :meth:`close_download_clients`.
 
         Args:
             url: Full URL to download.
@@ -132,29 +157,108 @@ class InputFile:
         """
         limit = cls._DEFAULT_MAX_SIZE if max_size is None else max_size
 
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            follow_redirects=True,
-            proxy=proxy,
-        ) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-
-        if limit and len(resp.content) > limit:
-            size_mb = len(resp.content) / 1024 / 1024
-            raise ValueError(
-                f"Downloaded file is too large: {size_mb:.1f} MB "
-                f"(limit {limit / 1024 / 1024:.0f} MB)"
-            )
+        # Small bodies stay in memory as bytes; past _SPOOL_MEMORY_SIZE they
+        # move to a temporary file.  Not a SpooledTemporaryFile: httpx asks
+        # the upload for fileno(), which would roll even a tiny one to disk.
+        chunks: list[bytes] = []
+        spool: BinaryIO | None = None
+        try:
+            async with _download_client(proxy).stream("GET", url, timeout=timeout) as resp:
+                resp.raise_for_status()
+                declared = int(resp.headers.get("content-length", 0))
+                if limit and declared > limit:
+                    raise _too_large(declared, limit)
+                size = 0
+                async for chunk in resp.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if limit and size > limit:
+                        raise _too_large(size, limit, partial=True)
+                    if spool is not None:
+                        spool.write(chunk)
+                        continue
+                    chunks.append(chunk)
+                    if size > _SPOOL_MEMORY_SIZE:
+                        spool = TemporaryFile()  # noqa: SIM115 (owned by result)
+                        spool.writelines(chunks)
+                        chunks.clear()
+        except BaseException:
+            if spool is not None:
+                spool.close()
+            raise
 
         if filename is None:
             filename = _filename_from_url(url)
 
-        return cls(file=resp.content, filename=filename)
+        if spool is None:
+            return cls(file=b"".join(chunks), filename=filename)
+        spool.seek(0)
+        return cls(file=spool, filename=filename)
+
+    @staticmethod
+    async def close_download_clients() -> None:
+        """Close the clients :meth:`from_url` keeps open on this event loop.
+
+        The dispatcher calls this when polling stops; call it yourself if
+        you use ``from_url`` without the dispatcher.
+        """
+        clients = _download_clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+
+
+_SPOOL_MEMORY_SIZE = 1024 * 1024  # from_url keeps smaller downloads in RAM
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# from_url clients by event loop, then by proxy: pooled connections belong
+# to the loop that opened them, and httpx fixes the proxy per client
+_download_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str | None, httpx.AsyncClient]
+] = weakref.WeakKeyDictionary()
+
+
+def _download_client(proxy: str | None) -> httpx.AsyncClient:
+    clients = _download_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(proxy)
+    if client is None or client.is_closed:
+        client = clients[proxy] = httpx.AsyncClient(follow_redirects=True, proxy=proxy)
+    return client
+
+
+def _too_large(size: int, limit: int, partial: bool = False) -> ValueError:
+    over = "over " if partial else ""
+    return ValueError(
+        f"Downloaded file is too large: {over}{size / 1024 / 1024:.1f} MB "
+        f"(limit {limit / 1024 / 1024:.0f} MB)"
+    )
 
 
 def _filename_from_url(url: str) -> str | None:
-    """Extract a filename from the URL path, e.g. ``photo.jpg``."""
-    path = unquote(urlparse(url).path)
-    name = Path(path).name
+    """Extract a filename from the URL path, e.g. ``photo.jpg``.
+
+    Slices the string instead of building a ``urlparse`` result; query,
+    fragment and ``;params`` are dropped the same way ``urlparse`` does.
+    """
+    path = url.partition("#")[0].partition("?")[0]
+    if path.startswith("//"):
+        host = 2
+    else:
+        host = path.find("://")
+        if host != -1:
+            host += 3
+    if host != -1:
+        # skip the host: "https://example.com" has no path at all
+        slash = path.find("/", host)
+        if slash == -1:
+            return None
+        path = path[slash:]
+    head, sep, last = path.rpartition("/")
+    if ";" in last:
+        path = head + sep + last.partition(";")[0]
+    if "%" in path:
+        path = unquote(path)
+    # like Path(path).name: trailing "/" and "/." segments don't count
+    path = path.rstrip("/")
+    while path.endswith("/.") or path == ".":
+        path = path[:-1].rstrip("/")
+    name = path.rpartition("/")[2]
     return name if name and "." in name else None
@@ -27,6 +27,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import functools
+import logging
 from collections.abc import Callable, Coroutine
 from typing import TYPE_CHECKING, Any
 
@@ -35,6 +36,8 @@ from vkworkspace.enums.chat_action import ChatAction
 if TYPE_CHECKING:
     from vkworkspace.client.bot import Bot
 
+logger = logging.getLogger(__name__)
+
 
 def typing_action(
     func: Callable[..., Coroutine[Any, Any, Any]] | None = None,
@@ -75,18 +78,8 @@ def typing_action(
             if not chat_id or not bot:
                 return await fn(event, **kwargs)
 
-            async def _keep_sending() -> None:
-                while True:
-                    await bot.send_actions(chat_id, str(action))
-                    await asyncio.sleep(interval)
-
-            task = asyncio.create_task(_keep_sending())
-            try:
+            async with ChatActionSender(bot=bot, chat_id=chat_id, action=action, interval=interval):
                 return await fn(event, **kwargs)
-            finally:
-                task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await task
 
         return wrapper
 
@@ -137,23 +130,32 @@ class ChatActionSender:
         self.chat_id = chat_id
         self.action = str(action)
         self.interval = interval
-        self._task: asyncio.Task[None] | None = None
-
-    async def _keep_sending(self) -> None:
-        while True:
-            await self.bot.send_actions(self.chat_id, self.action)
-            await asyncio.sleep(self.interval)
+        self._handle: asyncio.TimerHandle | None = None
+        self._sending: asyncio.Task[Any] | None = None
+
+    def _tick(self) -> None:
+        # A timer callback that re-arms itself rather than a task sleeping
+        # in a loop. A resend is skipped while the previous request is
+        # still in flight, so a slow API doesn't pile up requests.
+        loop = asyncio.get_running_loop()
+        if self._sending is None or self._sending.done():
+            self._sending = loop.create_task(self.bot.send_actions(self.chat_id, self.action))
+            self._sending.add_done_callback(_log_send_failure)
+        self._handle = loop.call_later(self.interval, self._tick)
 
     async def __aenter__(self) -> ChatActionSender:
-        self._task = asyncio.create_task(self._keep_sending())
+        self._tick()
         return self
 
     async def __aexit__(self, *args: object) -> None:
-        if self._task is not None:
-            self._task.cancel()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        sending, self._sending = self._sending, None
+        if sending is not None and not sending.done():
+            sending.cancel()
             with contextlib.suppress(asyncio.CancelledError):
-                await self._task
-            self._task = None
+                await sending
 
     # ── Convenience constructors ──────────────────────────────────
 
@@ -176,3 +178,10 @@ class ChatActionSender:
     ) -> ChatActionSender:
         """Shortcut for ``ChatActionSender(..., action=ChatAction.LOOKING)``."""
         return cls(bot=bot, chat_id=chat_id, action=ChatAction.LOOKING, interval=interval)
+
+
+def _log_send_failure(task: asyncio.Task[Any]) -> None:
+    # The action indicator is cosmetic: a failed send must not break the
+    # handler it decorates, but shouldn't vanish silently either
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        logger.warning("Failed to send chat action: %s", exc)
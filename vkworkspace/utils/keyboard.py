@@ -102,6 +102,14 @@ class InlineKeyboardBuilder:
         self._rows.append(list(buttons))
         return self
 
+    def add_row(self, buttons: list[InlineKeyboardButton]) -> InlineKeyboardBuilder:
+        """Add an already built list of buttons as one row, without copying.
+
+        The builder takes the list over: don't modify it afterwards.
+        """
+        self._rows.append(buttons)
+        return self
+
     def adjust(self, *sizes: int) -> InlineKeyboardBuilder:
         """Arrange flat buttons into rows.
 
@@ -117,8 +125,7 @@ class InlineKeyboardBuilder:
         if not sizes:
             sizes = (1,)
 
-        buttons = list(self._buttons)
-        self._buttons.clear()
+        buttons, self._buttons = self._buttons, []
 
         idx = 0
         size_idx = 0
@@ -15,7 +15,7 @@ Example::
         paginator = Paginator(data=items, per_page=3, current_page=0, name="fruits")
 
         builder = InlineKeyboardBuilder()
-        for i, fruit in enumerate(paginator.page_data, paginator.offset + 1):
+        for i, fruit in enumerate(paginator.iter_page(), paginator.offset + 1):
             builder.button(text=f"{i}. {fruit}", callback_data=f"fruit:{fruit}")
         builder.adjust(1)
         paginator.add_nav_row(builder)
@@ -30,8 +30,7 @@ Example::
 
 from __future__ import annotations
 
-import math
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from typing import Any
 
 from vkworkspace.filters.callback_data import CallbackDataFactory
@@ -64,11 +63,14 @@ class Paginator:
 
         paginator = Paginator(data=products, per_page=5, current_page=0, name="shop")
         paginator.page_data        # items for current page
+        paginator.iter_page()      # same items, lazily (no list copy)
         paginator.total_pages      # total number of pages
         paginator.has_next         # True if there's a next page
         paginator.add_nav_row(builder)  # adds [◀] [2/5] [▶] to builder
     """
 
+    __slots__ = ("_data", "_per_page", "_total_pages", "current_page", "name")
+
     def __init__(
         self,
         data: Sequence[Any],
@@ -76,26 +78,50 @@ class Paginator:
         current_page: int = 0,
         name: str = "page",
     ) -> None:
-        self.data = data
-        self.per_page = max(1, per_page)
+        self._data = data
+        self._per_page = max(1, per_page)
+        self._count_pages()
         self.current_page = max(0, current_page)
         self.name = name
 
+    def _count_pages(self) -> None:
+        self._total_pages = max(1, -(-len(self._data) // self._per_page))
+
+    @property
+    def data(self) -> Sequence[Any]:
+        """Full list of items being paginated."""
+        return self._data
+
+    @data.setter
+    def data(self, data: Sequence[Any]) -> None:
+        self._data = data
+        self._count_pages()
+
+    @property
+    def per_page(self) -> int:
+        """Items per page."""
+        return self._per_page
+
+    @per_page.setter
+    def per_page(self, per_page: int) -> None:
+        self._per_page = max(1, per_page)
+        self._count_pages()
+
     @property
     def total_pages(self) -> int:
-        """Total number of pages."""
-        return max(1, math.ceil(len(self.data) / self.per_page))
+        """Total number of pages (counted when ``data`` or ``per_page`` is set)."""
+        return self._total_pages
 
     @property
     def offset(self) -> int:
         """Start index of the current page (0-based)."""
-        return self.current_page * self.per_page
+        return self.current_page * self._per_page
 
     @property
     def page_data(self) -> Sequence[Any]:
         """Items for the current page."""
         start = self.offset
-        return self.data[start : start + self.per_page]
+        return self._data[start : start + self._per_page]
 
     @property
     def has_prev(self) -> bool:
@@ -105,7 +131,18 @@ class Paginator:
     @property
     def has_next(self) -> bool:
         """``True`` if there is a next page."""
-        return self.current_page < self.total_pages - 1
+        return self.current_page < self._total_pages - 1
+
+    def iter_page(self) -> Iterator[Any]:
+        """Iterate over the current page's items without copying them.
+
+        Unlike :attr:`page_data` no new list is built — handy when the
+        items are only looped over once to add buttons.  Setup is O(1):
+        items are fetched by index, not by skipping ``offset`` elements.
+        """
+        start = self.offset
+        stop = min(start + self._per_page, len(self._data))
+        return map(self._data.__getitem__, range(start, stop))
 
     def nav_buttons(self) -> list[InlineKeyboardButton]:
         """Build navigation buttons: ``[◀] [2/5] [▶]``.
@@ -115,39 +152,24 @@ class Paginator:
         if self.total_pages <= 1:
             return []
 
+        # Same strings as PaginationCB(name=..., page=...).pack(), without
+        # building and validating three models per render
+        base = f"{PaginationCB.__callback_head__}{self.name}{PaginationCB.__callback_sep__}"
+        page = self.current_page
         buttons: list[InlineKeyboardButton] = []
 
         if self.has_prev:
-            buttons.append(
-                InlineKeyboardButton(
-                    text="◀",
-                    callback_data=PaginationCB(
-                        name=self.name,
-                        page=self.current_page - 1,
-                    ).pack(),
-                )
-            )
+            buttons.append(InlineKeyboardButton(text="◀", callback_data=f"{base}{page - 1}"))
 
         buttons.append(
             InlineKeyboardButton(
-                text=f"{self.current_page + 1}/{self.total_pages}",
-                callback_data=PaginationCB(
-                    name=self.name,
-                    page=self.current_page,
-                ).pack(),
+                text=f"{page + 1}/{self.total_pages}",
+                callback_data=f"{base}{page}",
             )
         )
 
         if self.has_next:
-            buttons.append(
-                InlineKeyboardButton(
-                    text="▶",
-                    callback_data=PaginationCB(
-                        name=self.name,
-                        page=self.current_page + 1,
-                    ).pack(),
-                )
-            )
+            buttons.append(InlineKeyboardButton(text="▶", callback_data=f"{base}{page + 1}"))
 
         return buttons
 
@@ -164,5 +186,5 @@ class Paginator:
         """
         buttons = self.nav_buttons()
         if buttons:
-            builder.row(*buttons)
+            builder.add_row(buttons)  # freshly built list: no need to copy
         return builder
@@ -41,17 +41,24 @@ Usage::
 from __future__ import annotations
 
 import asyncio
+import heapq
 import inspect
+import itertools
 import logging
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable
-from datetime import datetime, timedelta
+from collections.abc import Awaitable, Callable, Coroutine
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 SchedulerFunc = Callable[..., Awaitable[Any]]
 
+_DAY = 86400
+_WEEK = 7 * _DAY
+# A daily/weekly job finishing this close to its own time already ran
+_REFIRE_GUARD = 61
+
 
 class _Job(ABC):
     """Base class for scheduled jobs."""
@@ -59,32 +66,24 @@ class _Job(ABC):
     def __init__(self, func: SchedulerFunc, name: str | None = None) -> None:
         self.func = func
         self.name = name or func.__name__
-        # Inspect signature for DI-style kwarg filtering
-        sig = inspect.signature(func)
-        self._params: set[str] = set()
-        self._has_kwargs = False
-        for param_name, param in sig.parameters.items():
-            if param.kind == inspect.Parameter.VAR_KEYWORD:
-                self._has_kwargs = True
-            else:
-                self._params.add(param_name)
-
-    async def _call(self, bot: Any, extra: dict[str, Any]) -> None:
-        """Call the job function with signature-filtered kwargs."""
+        # Inspect signature once, at registration, for DI-style kwarg filtering
+        params = inspect.signature(func).parameters.values()
+        self._has_kwargs = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in params)
+        self._params = frozenset(p.name for p in params if p.kind != inspect.Parameter.VAR_KEYWORD)
+
+    def filter_kwargs(self, extra: dict[str, Any]) -> dict[str, Any]:
+        """The subset of *extra* this job's function accepts."""
         if self._has_kwargs:
-            await self.func(bot, **extra)
-        else:
-            filtered = {k: v for k, v in extra.items() if k in self._params}
-            await self.func(bot, **filtered)
+            return extra
+        return {k: v for k, v in extra.items() if k in self._params}
 
     @abstractmethod
-    async def run(
-        self,
-        bot: Any,
-        is_running: Callable[[], bool],
-        extra: dict[str, Any],
-    ) -> None:
-        """Run the job loop until is_running() returns False."""
+    def first_delay(self) -> float:
+        """Seconds from :meth:`Scheduler.start` until the first run."""
+
+    @abstractmethod
+    def next_delay(self) -> float:
+        """Seconds from the end of a run until the next one."""
 
 
 class _IntervalJob(_Job):
@@ -101,21 +100,11 @@ class _IntervalJob(_Job):
         self.seconds = seconds
         self.run_at_start = run_at_start
 
-    async def run(
-        self,
-        bot: Any,
-        is_running: Callable[[], bool],
-        extra: dict[str, Any],
-    ) -> None:
-        if not self.run_at_start:
-            await _interruptible_sleep(self.seconds, is_running)
+    def first_delay(self) -> float:
+        return 0.0 if self.run_at_start else self.seconds
 
-        while is_running():
-            try:
-                await self._call(bot, extra)
-            except Exception:
-                logger.exception("Scheduler job '%s' failed", self.name)
-            await _interruptible_sleep(self.seconds, is_running)
+    def next_delay(self) -> float:
+        return self.seconds
 
 
 class _DailyJob(_Job):
@@ -132,26 +121,14 @@ class _DailyJob(_Job):
         self.hour = hour
         self.minute = minute
 
-    async def run(
-        self,
-        bot: Any,
-        is_running: Callable[[], bool],
-        extra: dict[str, Any],
-    ) -> None:
-        while is_running():
-            wait = _seconds_until(self.hour, self.minute)
-            await _interruptible_sleep(wait, is_running)
-
-            if not is_running():
-                break
-
-            try:
-                await self._call(bot, extra)
-            except Exception:
-                logger.exception("Scheduler job '%s' failed", self.name)
+    def first_delay(self) -> float:
+        return _seconds_until(self.hour, self.minute)
 
-            # Sleep 61s to avoid double-firing within the same minute
-            await _interruptible_sleep(61, is_running)
+    def next_delay(self) -> float:
+        wait = _seconds_until(self.hour, self.minute)
+        # Woke up a little early and finished within the same minute:
+        # today's occurrence is done, don't fire it twice
+        return wait if wait > _REFIRE_GUARD else wait + _DAY
 
 
 class _WeeklyJob(_Job):
@@ -170,32 +147,18 @@ class _WeeklyJob(_Job):
         self.hour = hour
         self.minute = minute
 
-    async def run(
-        self,
-        bot: Any,
-        is_running: Callable[[], bool],
-        extra: dict[str, Any],
-    ) -> None:
-        while is_running():
-            wait = _seconds_until_weekday(self.weekday, self.hour, self.minute)
-            await _interruptible_sleep(wait, is_running)
-
-            if not is_running():
-                break
+    def first_delay(self) -> float:
+        return _seconds_until_weekday(self.weekday, self.hour, self.minute)
 
-            try:
-                await self._call(bot, extra)
-            except Exception:
-                logger.exception("Scheduler job '%s' failed", self.name)
-
-            # Sleep 61s to avoid double-firing
-            await _interruptible_sleep(61, is_running)
+    def next_delay(self) -> float:
+        wait = _seconds_until_weekday(self.weekday, self.hour, self.minute)
+        return wait if wait > _REFIRE_GUARD else wait + _WEEK
 
 
 class Scheduler:
     """Lightweight async task scheduler for bot periodic tasks.
 
-    Zero dependencies — uses only ``asyncio`` and ``datetime``.
+    Zero dependencies — uses only ``asyncio`` and ``time``.
 
     Register jobs with decorators, then call :meth:`start` in your
     ``on_startup`` hook. Jobs receive the ``bot`` instance as first argument.
@@ -219,8 +182,13 @@ class Scheduler:
 
     def __init__(self) -> None:
         self._jobs: list[_Job] = []
-        self._tasks: list[asyncio.Task[None]] = []
+        # The timer loop plus the job runs currently in flight
+        self._tasks: set[asyncio.Task[None]] = set()
         self._running = False
+        # (loop time of next run, seq, job) — seq keeps jobs out of comparisons
+        self._queue: list[tuple[float, int, _Job]] = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()  # re-created per start(): loop-bound
 
     # ── decorators ────────────────────────────────────────────────────
 
@@ -308,7 +276,7 @@ class Scheduler:
     # ── lifecycle ─────────────────────────────────────────────────────
 
     def start(self, bot: Any, **kwargs: Any) -> None:
-        """Start all scheduled jobs as background tasks.
+        """Start all scheduled jobs on a single background timer task.
 
         Extra keyword arguments are injected into job functions by
         parameter name (like middleware data in handlers).
@@ -339,12 +307,13 @@ class Scheduler:
             logger.warning("Scheduler is already running")
             return
         self._running = True
-        for job in self._jobs:
-            task = asyncio.create_task(
-                job.run(bot, lambda: self._running, kwargs),
-                name=f"scheduler:{job.name}",
-            )
-            self._tasks.append(task)
+        self._wakeup = asyncio.Event()
+        now = asyncio.get_running_loop().time()
+        self._queue = [(now + job.first_delay(), next(self._seq), job) for job in self._jobs]
+        heapq.heapify(self._queue)
+        # The dependencies are fixed for this run: filter them once per job
+        injected = {job: job.filter_kwargs(kwargs) for job in self._jobs}
+        self._spawn(self._run(bot, injected), "scheduler")
         logger.info(
             "Scheduler started: %s",
             ", ".join(j.name for j in self._jobs) or "(no jobs)",
@@ -358,15 +327,64 @@ class Scheduler:
             @dp.on_shutdown
             async def teardown():
                 await scheduler.stop()
+
+        Calling it when the scheduler isn't running does nothing.
         """
+        if not self._running:
+            return
         self._running = False
-        for task in self._tasks:
-            if not task.done():
-                task.cancel()
-        await asyncio.gather(*self._tasks, return_exceptions=True)
+        # Cancel everything first, then wait once for all of it together
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         self._tasks.clear()
+        self._queue.clear()
         logger.info("Scheduler stopped")
 
+    # ── timer loop ────────────────────────────────────────────────────
+
+    def _spawn(self, coro: Coroutine[Any, Any, None], name: str) -> None:
+        task = asyncio.create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, bot: Any, injected: dict[_Job, dict[str, Any]]) -> None:
+        """Single timer for all jobs: sleep until the earliest one is due.
+
+        Due jobs run as their own tasks so a slow job doesn't hold up the
+        others; each is pushed back onto the queue when its run finishes,
+        so runs of the same job never overlap.
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        wakeup = self._wakeup
+        while True:
+            # The only clock read per wake-up: every job due by now is
+            # dispatched against it, and the sleep below uses the next due
+            # time as an absolute deadline rather than a delay from now
+            now = loop.time()
+            while queue and queue[0][0] <= now:
+                job = heapq.heappop(queue)[2]
+                self._spawn(self._run_job(job, bot, injected[job]), f"scheduler:{job.name}")
+
+            wakeup.clear()
+            try:
+                async with asyncio.timeout_at(queue[0][0] if queue else None):
+                    await wakeup.wait()
+            except TimeoutError:
+                pass
+
+    async def _run_job(self, job: _Job, bot: Any, kwargs: dict[str, Any]) -> None:
+        try:
+            await job.func(bot, **kwargs)
+        except Exception:
+            logger.exception("Scheduler job '%s' failed", job.name)
+        if self._running:
+            due = asyncio.get_running_loop().time() + job.next_delay()
+            heapq.heappush(self._queue, (due, next(self._seq), job))
+            self._wakeup.set()
+
     @property
     def is_running(self) -> bool:
         """Whether the scheduler is currently running."""
@@ -381,39 +399,25 @@ class Scheduler:
 # ── helpers ──────────────────────────────────────────────────────────
 
 
-async def _interruptible_sleep(
-    seconds: float,
-    is_running: Callable[[], bool],
-    chunk: float = 5.0,
-) -> None:
-    """Sleep in small chunks so we can check is_running() and exit fast."""
-    remaining = seconds
-    while remaining > 0 and is_running():
-        await asyncio.sleep(min(chunk, remaining))
-        remaining -= chunk
-
-
 def _seconds_until(hour: int, minute: int) -> float:
     """Seconds from now until next occurrence of hour:minute today/tomorrow."""
-    now = datetime.now()
-    target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-    if target <= now:
-        target += timedelta(days=1)
-    return (target - now).total_seconds()
+    wait = hour * 3600 + minute * 60 - _seconds_into_day()[0]
+    return wait if wait > 0 else wait + _DAY
 
 
 def _seconds_until_weekday(weekday: int, hour: int, minute: int) -> float:
     """Seconds from now until next occurrence of weekday at hour:minute."""
-    now = datetime.now()
-    days_ahead = weekday - now.weekday()
-    if days_ahead < 0:
-        days_ahead += 7
-    target = now.replace(
-        hour=hour,
-        minute=minute,
-        second=0,
-        microsecond=0,
-    ) + timedelta(days=days_ahead)
-    if target <= now:
-        target += timedelta(weeks=1)
-    return (target - now).total_seconds()
+    elapsed, today = _seconds_into_day()
+    wait = (weekday - today) % 7 * _DAY + hour * 3600 + minute * 60 - elapsed
+    return wait if wait > 0 else wait + _WEEK
+
+
+def _seconds_into_day() -> tuple[float, int]:
+    """Local time of day in seconds, and the weekday (0=Monday).
+
+    Plain ``struct_time`` arithmetic: no datetime/timedelta objects are
+    built on every scheduling step.
+    """
+    now = time.time()
+    lt = time.localtime(now)
+    return lt.tm_hour * 3600 + lt.tm_min * 60 + lt.tm_sec + now % 1, lt.tm_wday